@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for the Flask web application
+
+Usage (from the project root):
+    gunicorn -c gunicorn.conf.py python.web_app:app
+"""
+
+bind = '0.0.0.0:5000'
+
+# pandas/pyarrow parsing and cx_Oracle calls block in C, so use real threads
+# (they release the GIL) rather than gevent. A single worker keeps the
+# in-memory demo job registry and file caches shared.
+worker_class = 'gthread'
+workers = 1
+threads = 8
+timeout = 120
+
+accesslog = '-'
+errorlog = '-'
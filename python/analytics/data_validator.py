@@ -4,7 +4,9 @@ Calls PL/SQL validation procedures
 """
 
 import cx_Oracle
-from python.data_loader.oracle_connector import OracleConnector
+from concurrent.futures import ThreadPoolExecutor
+from python.data_loader.oracle_connector import OracleConnector, get_pool
+from python.utils.config_loader import load_config
 from python.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -21,16 +23,38 @@ class DataValidator:
         """
         Run all validation checks
         
+        The checks touch different tables and are independent, so each runs
+        concurrently on its own pooled connection.
+        
         Returns:
             dict: Validation results
         """
-        results = {}
+        checks = {
+            'sales_data': self._validate_sales_data,
+            'referential_integrity': self._validate_referential_integrity,
+            'duplicates': self._check_duplicates
+        }
+        
+        # Create the shared pool up front so the workers only acquire from it
+        get_pool(load_config())
+        
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {name: executor.submit(check) for name, check in checks.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        
+        logger.info(f"Validation complete. Results: {results}")
+        return results
+    
+    def _validate_sales_data(self):
+        """
+        Validate sales data
         
+        Returns:
+            dict: Status and record counts
+        """
+        logger.info("Validating sales data...")
         with OracleConnector() as db:
             cursor = db.cursor
-            
-            # Validate Sales Data
-            logger.info("Validating sales data...")
             result = cursor.var(str)
             records_checked = cursor.var(int)
             records_passed = cursor.var(int)
@@ -41,15 +65,23 @@ class DataValidator:
                 [None, result, records_checked, records_passed, records_failed]
             )
             
-            results['sales_data'] = {
+            return {
                 'status': result.getvalue(),
                 'checked': records_checked.getvalue(),
                 'passed': records_passed.getvalue(),
                 'failed': records_failed.getvalue()
             }
-            
-            # Validate Referential Integrity
-            logger.info("Validating referential integrity...")
+    
+    def _validate_referential_integrity(self):
+        """
+        Validate referential integrity
+        
+        Returns:
+            dict: Status and error details
+        """
+        logger.info("Validating referential integrity...")
+        with OracleConnector() as db:
+            cursor = db.cursor
             ref_result = cursor.var(str)
             error_details = cursor.var(cx_Oracle.CLOB)
             
@@ -58,13 +90,21 @@ class DataValidator:
                 [ref_result, error_details]
             )
             
-            results['referential_integrity'] = {
+            return {
                 'status': ref_result.getvalue(),
                 'details': str(error_details.getvalue()) if error_details.getvalue() else ''
             }
-            
-            # Check Duplicates
-            logger.info("Checking for duplicates...")
+    
+    def _check_duplicates(self):
+        """
+        Check for duplicate transactions
+        
+        Returns:
+            dict: Status and duplicate count
+        """
+        logger.info("Checking for duplicates...")
+        with OracleConnector() as db:
+            cursor = db.cursor
             dup_result = cursor.var(str)
             dup_count = cursor.var(int)
             
@@ -73,11 +113,7 @@ class DataValidator:
                 [dup_result, dup_count]
             )
             
-            results['duplicates'] = {
+            return {
                 'status': dup_result.getvalue(),
                 'count': dup_count.getvalue()
             }
-        
-        logger.info(f"Validation complete. Results: {results}")
-        return results
-
@@ -3,14 +3,50 @@ Insight Generator
 AI-like rule-based insights generation
 """
 
-import pandas as pd
-from datetime import datetime, timedelta
+import asyncio
 from python.data_loader.oracle_connector import OracleConnector
 from python.utils.logger import setup_logger
 from python.utils.config_loader import load_config
 
 logger = setup_logger(__name__)
 
+# One scan per KPI: mean/stddev over all rows, plus row count and the
+# oldest/newest value of the last :periods rows for trend detection
+KPI_STATS_QUERY = """
+    WITH k AS (
+        SELECT KPI_VALUE,
+               ROW_NUMBER() OVER (ORDER BY KPI_DATE DESC) AS rn,
+               COUNT(*) OVER () AS total
+        FROM KPI_RESULTS
+        WHERE KPI_NAME = :kpi_name
+    )
+    SELECT AVG(KPI_VALUE) AS mean_v,
+           STDDEV(KPI_VALUE) AS std_v,
+           NVL(LEAST(MAX(total), :periods), 0) AS cnt,
+           MAX(CASE WHEN rn = LEAST(total, :periods) THEN KPI_VALUE END) AS first_v,
+           MAX(CASE WHEN rn = 1 THEN KPI_VALUE END) AS last_v
+    FROM k
+"""
+
+OUTLIER_ROWS_QUERY = """
+    SELECT KPI_DATE, KPI_VALUE, REGION_ID
+    FROM KPI_RESULTS
+    WHERE KPI_NAME = :kpi_name
+    AND (KPI_VALUE > :upper OR KPI_VALUE < :lower)
+    ORDER BY KPI_DATE DESC
+"""
+
+KPI_STATS_COLUMNS = ('mean', 'std', 'count', 'first', 'last')
+
+TOP_CUSTOMERS_COUNT_QUERY = """
+    SELECT COUNT(*) as top_customer_count
+    FROM KPI_RESULTS
+    WHERE KPI_NAME = 'TOP_CUSTOMERS'
+    AND KPI_DATE >= SYSDATE - 7
+"""
+
+OUTLIER_COLUMNS = ('KPI_DATE', 'KPI_VALUE', 'REGION_ID')
+
 
 class InsightGenerator:
     """Rule-based insight generator"""
@@ -24,6 +60,36 @@ class InsightGenerator:
         """
         self.config = load_config(config_path)
         self.thresholds = self.config.get('kpi_thresholds', {})
+        # Per-summary memo of KPI stats, shared by outlier and trend detection
+        self._kpi_stats = None
+    
+    def _fetch_kpi_stats(self, kpi_name, periods=None):
+        """
+        Fetch mean, stddev and trend endpoints for a KPI in one query
+        
+        Args:
+            kpi_name: Name of KPI
+            periods: Number of most recent periods used for the trend endpoints
+            
+        Returns:
+            dict: mean, std, count, first and last values
+        """
+        if periods is None:
+            periods = self.thresholds.get('trend_detection_periods', 3)
+        
+        key = (kpi_name, periods)
+        if self._kpi_stats is not None and key in self._kpi_stats:
+            return self._kpi_stats[key]
+        
+        with OracleConnector() as db:
+            results = db.execute_query(
+                KPI_STATS_QUERY, {'kpi_name': kpi_name, 'periods': periods}, cache=True
+            )
+        
+        stats = dict(zip(KPI_STATS_COLUMNS, results[0]))
+        if self._kpi_stats is not None:
+            self._kpi_stats[key] = stats
+        return stats
     
     def detect_outliers(self, kpi_name, threshold_percent=None):
         """
@@ -39,32 +105,18 @@ class InsightGenerator:
         if threshold_percent is None:
             threshold_percent = self.thresholds.get('revenue_anomaly_percentage', 20)
         
+        stats = self._fetch_kpi_stats(kpi_name)
+        if stats['mean'] is None:
+            return []
+        
         with OracleConnector() as db:
-            query = """
-                SELECT KPI_DATE, KPI_VALUE, REGION_ID
-                FROM KPI_RESULTS
-                WHERE KPI_NAME = :kpi_name
-                ORDER BY KPI_DATE DESC
-            """
-            results = db.execute_query(query, {'kpi_name': kpi_name})
-            
-            if not results:
-                return []
-            
-            df = pd.DataFrame(results, columns=['KPI_DATE', 'KPI_VALUE', 'REGION_ID'])
-            
-            # Calculate mean and standard deviation
-            mean_value = df['KPI_VALUE'].mean()
-            std_value = df['KPI_VALUE'].std()
-            
-            # Identify outliers (values beyond threshold)
-            threshold = mean_value * (threshold_percent / 100)
-            outliers = df[
-                (df['KPI_VALUE'] > mean_value + threshold) |
-                (df['KPI_VALUE'] < mean_value - threshold)
-            ]
-            
-            return outliers.to_dict('records')
+            results = db.execute_query(
+                OUTLIER_ROWS_QUERY,
+                self._outlier_bounds(kpi_name, stats['mean'], threshold_percent),
+                cache=True
+            )
+        
+        return [dict(zip(OUTLIER_COLUMNS, row)) for row in results]
     
     def detect_trends(self, kpi_name, periods=None):
         """
@@ -80,64 +132,202 @@ class InsightGenerator:
         if periods is None:
             periods = self.thresholds.get('trend_detection_periods', 3)
         
-        with OracleConnector() as db:
-            query = """
-                SELECT KPI_DATE, KPI_VALUE
-                FROM KPI_RESULTS
-                WHERE KPI_NAME = :kpi_name
-                ORDER BY KPI_DATE DESC
-                FETCH FIRST :periods ROWS ONLY
-            """
-            results = db.execute_query(query, {'kpi_name': kpi_name, 'periods': periods})
-            
-            if len(results) < periods:
-                return "Insufficient data for trend analysis"
+        return self._describe_trend(self._fetch_kpi_stats(kpi_name, periods), periods)
+    
+    @staticmethod
+    def _outlier_bounds(kpi_name, mean_value, threshold_percent):
+        """
+        Build OUTLIER_ROWS_QUERY binds from the KPI mean
+        
+        Args:
+            kpi_name: Name of KPI
+            mean_value: Mean KPI value
+            threshold_percent: Percentage threshold for anomaly
             
-            df = pd.DataFrame(results, columns=['KPI_DATE', 'KPI_VALUE'])
-            df = df.sort_values('KPI_DATE')
+        Returns:
+            dict: Query parameters
+        """
+        threshold = mean_value * (threshold_percent / 100)
+        return {
+            'kpi_name': kpi_name,
+            'upper': mean_value + threshold,
+            'lower': mean_value - threshold
+        }
+    
+    @staticmethod
+    def _describe_trend(stats, periods):
+        """
+        Describe the trend from KPI stats
+        
+        Args:
+            stats: KPI stats from _fetch_kpi_stats
+            periods: Number of periods analyzed
             
-            # Calculate trend
-            values = df['KPI_VALUE'].values
-            if len(values) >= 2:
-                trend = "increasing" if values[-1] > values[0] else "decreasing"
-                change_percent = ((values[-1] - values[0]) / values[0]) * 100
-                
-                return f"Trend: {trend} ({change_percent:.2f}% change over {periods} periods)"
+        Returns:
+            str: Trend description
+        """
+        first_value, last_value = stats['first'], stats['last']
+        if stats['count'] < periods:
+            return "Insufficient data for trend analysis"
+        
+        # Calculate trend
+        if stats['count'] >= 2:
+            trend = "increasing" if last_value > first_value else "decreasing"
+            if first_value:
+                change_percent = ((last_value - first_value) / first_value) * 100
+            else:
+                change_percent = float('inf')
             
-            return "No clear trend detected"
+            return f"Trend: {trend} ({change_percent:.2f}% change over {periods} periods)"
+        
+        return "No clear trend detected"
     
     def generate_summary_insights(self):
         """
         Generate comprehensive summary insights
         
+        Returns:
+            str: Formatted insight summary
+        """
+        self._kpi_stats = {}
+        try:
+            # Revenue by Region insights
+            outliers = self.detect_outliers('REVENUE_BY_REGION')
+            
+            # Monthly trend
+            trend = self.detect_trends('MONTHLY_REVENUE_TREND')
+        finally:
+            self._kpi_stats = None
+        
+        # Top customers analysis
+        with OracleConnector() as db:
+            results = db.execute_query(TOP_CUSTOMERS_COUNT_QUERY, cache=True)
+        top_customer_count = results[0][0] if results else 0
+        
+        return self._format_insights(outliers, trend, top_customer_count)
+    
+    async def _fetch_kpi_stats_async(self, kpi_name, periods=None):
+        """
+        Async variant of _fetch_kpi_stats
+        
+        Args:
+            kpi_name: Name of KPI
+            periods: Number of most recent periods used for the trend endpoints
+            
+        Returns:
+            dict: mean, std, count, first and last values
+        """
+        from python.data_loader.async_oracle_connector import AsyncOracleConnector
+        
+        if periods is None:
+            periods = self.thresholds.get('trend_detection_periods', 3)
+        
+        async with AsyncOracleConnector() as db:
+            results = await db.execute_query(
+                KPI_STATS_QUERY, {'kpi_name': kpi_name, 'periods': periods}, cache=True
+            )
+        return dict(zip(KPI_STATS_COLUMNS, results[0]))
+    
+    async def detect_outliers_async(self, kpi_name, threshold_percent=None):
+        """
+        Async variant of detect_outliers
+        
+        Args:
+            kpi_name: Name of KPI
+            threshold_percent: Percentage threshold for anomaly
+            
+        Returns:
+            list: List of outlier records
+        """
+        from python.data_loader.async_oracle_connector import AsyncOracleConnector
+        
+        if threshold_percent is None:
+            threshold_percent = self.thresholds.get('revenue_anomaly_percentage', 20)
+        
+        stats = await self._fetch_kpi_stats_async(kpi_name)
+        if stats['mean'] is None:
+            return []
+        
+        async with AsyncOracleConnector() as db:
+            results = await db.execute_query(
+                OUTLIER_ROWS_QUERY,
+                self._outlier_bounds(kpi_name, stats['mean'], threshold_percent),
+                cache=True
+            )
+        
+        return [dict(zip(OUTLIER_COLUMNS, row)) for row in results]
+    
+    async def detect_trends_async(self, kpi_name, periods=None):
+        """
+        Async variant of detect_trends
+        
+        Args:
+            kpi_name: Name of KPI
+            periods: Number of periods to analyze
+            
+        Returns:
+            str: Trend description
+        """
+        if periods is None:
+            periods = self.thresholds.get('trend_detection_periods', 3)
+        
+        stats = await self._fetch_kpi_stats_async(kpi_name, periods)
+        return self._describe_trend(stats, periods)
+    
+    async def _count_top_customers_async(self):
+        """
+        Count TOP_CUSTOMERS KPI rows from the last 7 days
+        
+        Returns:
+            int: Row count
+        """
+        from python.data_loader.async_oracle_connector import AsyncOracleConnector
+        
+        async with AsyncOracleConnector() as db:
+            results = await db.execute_query(TOP_CUSTOMERS_COUNT_QUERY, cache=True)
+        return results[0][0] if results else 0
+    
+    async def generate_summary_insights_async(self):
+        """
+        Generate summary insights, issuing the three queries concurrently
+        
+        Requires python-oracledb; the sync generate_summary_insights
+        remains available without it.
+        
+        Returns:
+            str: Formatted insight summary
+        """
+        outliers, trend, top_customer_count = await asyncio.gather(
+            self.detect_outliers_async('REVENUE_BY_REGION'),
+            self.detect_trends_async('MONTHLY_REVENUE_TREND'),
+            self._count_top_customers_async()
+        )
+        return self._format_insights(outliers, trend, top_customer_count)
+    
+    @staticmethod
+    def _format_insights(outliers, trend, top_customer_count):
+        """
+        Format insight findings into a summary
+        
+        Args:
+            outliers: Revenue-by-region outlier records
+            trend: Monthly revenue trend description
+            top_customer_count: Recent TOP_CUSTOMERS KPI row count
+            
         Returns:
             str: Formatted insight summary
         """
         insights = []
         
-        # Revenue by Region insights
-        outliers = self.detect_outliers('REVENUE_BY_REGION')
         if outliers:
             insights.append(f"⚠️ Found {len(outliers)} revenue outliers by region")
         
-        # Monthly trend
-        trend = self.detect_trends('MONTHLY_REVENUE_TREND')
         insights.append(f"📈 Monthly Revenue: {trend}")
         
-        # Top customers analysis
-        with OracleConnector() as db:
-            query = """
-                SELECT COUNT(*) as top_customer_count
-                FROM KPI_RESULTS
-                WHERE KPI_NAME = 'TOP_CUSTOMERS'
-                AND KPI_DATE >= SYSDATE - 7
-            """
-            results = db.execute_query(query)
-            if results and results[0][0] > 0:
-                insights.append(f"👥 Top customers analysis available for last 7 days")
+        if top_customer_count > 0:
+            insights.append(f"👥 Top customers analysis available for last 7 days")
         
         summary = "\n".join(insights) if insights else "No significant insights detected"
         
         logger.info(f"Generated insights: {summary}")
         return summary
-
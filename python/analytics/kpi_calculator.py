@@ -3,7 +3,6 @@ KPI Calculator
 Calls PL/SQL procedures to calculate KPIs
 """
 
-import cx_Oracle
 from datetime import datetime, timedelta
 from python.data_loader.oracle_connector import OracleConnector
 from python.utils.logger import setup_logger
@@ -36,45 +35,23 @@ class KPICalculator:
         
         with OracleConnector() as db:
             try:
-                # Revenue by Region
-                logger.info("Calculating Revenue by Region...")
-                db.cursor.callproc(
-                    'PKG_KPI_CALCULATIONS.CALC_REVENUE_BY_REGION',
-                    [start_date, end_date]
+                # All five KPI procedures in one round-trip, committed once
+                logger.info(f"Calculating Revenue by Region, Monthly Revenue Trend, "
+                            f"Top {top_n} Customers, Product Performance, "
+                            f"Average Transaction Value...")
+                db.cursor.execute(
+                    """
+                    BEGIN
+                        PKG_KPI_CALCULATIONS.CALC_REVENUE_BY_REGION(:start_date, :end_date);
+                        PKG_KPI_CALCULATIONS.CALC_MONTHLY_REVENUE_TREND(:start_date, :end_date);
+                        PKG_KPI_CALCULATIONS.CALC_TOP_CUSTOMERS(:start_date, :end_date, :top_n);
+                        PKG_KPI_CALCULATIONS.CALC_PRODUCT_PERFORMANCE(:start_date, :end_date);
+                        PKG_KPI_CALCULATIONS.CALC_AVG_TRANSACTION_VALUE(:start_date, :end_date);
+                    END;
+                    """,
+                    {'start_date': start_date, 'end_date': end_date, 'top_n': top_n}
                 )
-                db.connection.commit()
-                
-                # Monthly Revenue Trend
-                logger.info("Calculating Monthly Revenue Trend...")
-                db.cursor.callproc(
-                    'PKG_KPI_CALCULATIONS.CALC_MONTHLY_REVENUE_TREND',
-                    [start_date, end_date]
-                )
-                db.connection.commit()
-                
-                # Top Customers
-                logger.info(f"Calculating Top {top_n} Customers...")
-                db.cursor.callproc(
-                    'PKG_KPI_CALCULATIONS.CALC_TOP_CUSTOMERS',
-                    [start_date, end_date, top_n]
-                )
-                db.connection.commit()
-                
-                # Product Performance
-                logger.info("Calculating Product Performance...")
-                db.cursor.callproc(
-                    'PKG_KPI_CALCULATIONS.CALC_PRODUCT_PERFORMANCE',
-                    [start_date, end_date]
-                )
-                db.connection.commit()
-                
-                # Average Transaction Value
-                logger.info("Calculating Average Transaction Value...")
-                db.cursor.callproc(
-                    'PKG_KPI_CALCULATIONS.CALC_AVG_TRANSACTION_VALUE',
-                    [start_date, end_date]
-                )
-                db.connection.commit()
+                db.commit()
                 
                 logger.info("All KPIs calculated successfully")
                 
@@ -96,16 +73,17 @@ class KPICalculator:
             list: KPI results
         """
         with OracleConnector() as db:
-            result_cursor = db.cursor.callfunc(
-                'PKG_KPI_CALCULATIONS.GET_KPI_RESULTS',
-                cx_Oracle.CURSOR,
-                [kpi_name, start_date, end_date]
+            # Fetch tuning only applies if set before the REF CURSOR is returned
+            result_cursor = db.connection.cursor()
+            result_cursor.arraysize = 10000
+            result_cursor.prefetchrows = result_cursor.arraysize + 1
+            db.cursor.execute(
+                "BEGIN :rc := PKG_KPI_CALCULATIONS.GET_KPI_RESULTS(:kpi_name, :start_date, :end_date); END;",
+                rc=result_cursor, kpi_name=kpi_name, start_date=start_date, end_date=end_date
             )
             
             columns = [desc[0] for desc in result_cursor.description]
-            results = []
-            for row in result_cursor:
-                results.append(dict(zip(columns, row)))
+            result_cursor.rowfactory = lambda *args: dict(zip(columns, args))
             
-            return results
+            return result_cursor.fetchall()
 
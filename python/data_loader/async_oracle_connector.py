@@ -0,0 +1,110 @@
+"""
+Async Oracle Database Connection Handler
+Uses python-oracledb's asyncio API (thin mode)
+"""
+
+import time
+import oracledb
+from python.data_loader.oracle_connector import _QUERY_CACHE
+from python.utils.config_loader import load_config
+from python.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Process-wide async pool, created on first connect
+_ASYNC_POOL = None
+
+
+def get_async_pool(config):
+    """
+    Get (lazily creating) the shared async Oracle connection pool
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        oracledb.AsyncConnectionPool: Connection pool
+    """
+    global _ASYNC_POOL
+    if _ASYNC_POOL is None:
+        db_config = config['database']
+        pool_config = db_config.get('pool', {})
+        _ASYNC_POOL = oracledb.create_pool_async(
+            user=db_config['username'],
+            password=db_config['password'],
+            dsn=f"{db_config['host']}:{db_config['port']}/{db_config['service_name']}",
+            min=pool_config.get('min', 2),
+            max=pool_config.get('max', 10),
+            increment=pool_config.get('increment', 1)
+        )
+        logger.info("Created async Oracle connection pool")
+    return _ASYNC_POOL
+
+
+class AsyncOracleConnector:
+    """Async Oracle database connection manager"""
+    
+    def __init__(self, config_path='config.yaml'):
+        """
+        Initialize async Oracle connector
+        
+        Args:
+            config_path: Path to configuration file
+        """
+        self.config = load_config(config_path)
+        self.connection = None
+    
+    async def connect(self):
+        """Acquire a connection from the async pool"""
+        try:
+            self.connection = await get_async_pool(self.config).acquire()
+        except Exception as e:
+            logger.error(f"Failed to connect to Oracle database: {str(e)}")
+            raise
+    
+    async def disconnect(self):
+        """Release connection back to the async pool"""
+        if self.connection:
+            await _ASYNC_POOL.release(self.connection)
+            self.connection = None
+    
+    async def execute_query(self, query, params=None, cache=False, ttl=300):
+        """
+        Execute SELECT query
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (dict)
+            cache: Serve/store the result in the in-memory query cache
+            ttl: Seconds a cached result stays valid
+            
+        Returns:
+            list: Query results
+        """
+        if cache:
+            key = (query, tuple(sorted((params or {}).items())))
+            cached = _QUERY_CACHE.get(key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return list(cached[1])
+        
+        try:
+            with self.connection.cursor() as cursor:
+                await cursor.execute(query, params or {})
+                results = await cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Query execution failed: {str(e)}")
+            raise
+        
+        if cache:
+            _QUERY_CACHE[key] = (time.monotonic(), results)
+            return list(results)
+        return results
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.disconnect()
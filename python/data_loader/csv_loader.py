@@ -3,7 +3,10 @@ CSV Data Loader
 Loads CSV files into Oracle database
 """
 
+import csv
+import cx_Oracle
 import pandas as pd
+from contextlib import nullcontext
 from pathlib import Path
 from python.data_loader.oracle_connector import OracleConnector
 from python.utils.logger import setup_logger
@@ -11,26 +14,72 @@ from python.utils.config_loader import load_config
 
 logger = setup_logger(__name__)
 
+REQUIRED_COLUMNS = ['transaction_date', 'customer_id', 'product_id',
+                    'quantity', 'unit_price', 'total_amount']
+
+CSV_COLUMNS = ['transaction_date', 'customer_id', 'product_id',
+               'quantity', 'unit_price', 'total_amount',
+               'region_id', 'discount_percentage']
+
+# Parse-time dtypes; ids are nullable so blank cells survive until fillna
+CSV_DTYPES = {
+    'customer_id': 'Int64',
+    'product_id': 'Int64',
+    'quantity': 'float64',
+    'unit_price': 'float64',
+    'total_amount': 'float64',
+    'region_id': 'Int64',
+    'discount_percentage': 'float64'
+}
+
+INSERT_QUERY = """
+    INSERT INTO SALES_TRANSACTIONS (
+        TRANSACTION_ID,
+        TRANSACTION_DATE,
+        CUSTOMER_ID,
+        PRODUCT_ID,
+        QUANTITY,
+        UNIT_PRICE,
+        TOTAL_AMOUNT,
+        REGION_ID,
+        DISCOUNT_PERCENTAGE,
+        LOAD_DATE
+    ) VALUES (
+        SEQ_TRANSACTION_ID.NEXTVAL,
+        :1, :2, :3, :4, :5, :6, :7, :8, SYSDATE
+    )
+"""
+
+INSERT_INPUT_SIZES = [cx_Oracle.DATETIME, int, int, cx_Oracle.NUMBER,
+                      cx_Oracle.NUMBER, cx_Oracle.NUMBER, int, cx_Oracle.NUMBER]
+
 
 class CSVLoader:
     """CSV file loader for Oracle database"""
     
-    def __init__(self, config_path='config.yaml'):
+    def __init__(self, config_path='config.yaml', chunk_size=50000):
         """
         Initialize CSV loader
         
         Args:
             config_path: Path to configuration file
+            chunk_size: Number of CSV rows read and inserted per chunk
         """
         self.config = load_config(config_path)
         self.input_path = Path(self.config['paths']['input_data'])
+        self.chunk_size = chunk_size
     
-    def load_sales_data(self, csv_file):
+    def load_sales_data(self, csv_file, db=None):
         """
         Load sales data from CSV into Oracle
         
+        The file is streamed in chunks so memory stays bounded by
+        chunk_size regardless of file size; all chunks are committed once.
+        
         Args:
             csv_file: Path to CSV file
+            db: Optional open OracleConnector; pass one when loading many
+                files so they share a session and its cached INSERT statement
             
         Returns:
             int: Number of records loaded
@@ -42,60 +91,33 @@ class CSVLoader:
         
         logger.info(f"Loading CSV file: {csv_path}")
         
-        # Read CSV
-        df = pd.read_csv(csv_path)
-        logger.info(f"Read {len(df)} records from CSV")
-        
-        # Validate required columns
-        required_columns = ['transaction_date', 'customer_id', 'product_id', 
-                           'quantity', 'unit_price', 'total_amount']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        # Validate required columns from the header before any DataFrame work
+        with open(csv_path, newline='', encoding='utf-8-sig') as f:
+            columns = next(csv.reader(f), [])
+        missing_columns = [col for col in REQUIRED_COLUMNS if col not in columns]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
         
-        # Clean and prepare data
-        df['transaction_date'] = pd.to_datetime(df['transaction_date'])
-        df = df.fillna(0)
-        
-        # Load into Oracle
-        with OracleConnector() as db:
-            # Get next sequence value for transaction_id
-            insert_query = """
-                INSERT INTO SALES_TRANSACTIONS (
-                    TRANSACTION_ID,
-                    TRANSACTION_DATE,
-                    CUSTOMER_ID,
-                    PRODUCT_ID,
-                    QUANTITY,
-                    UNIT_PRICE,
-                    TOTAL_AMOUNT,
-                    REGION_ID,
-                    DISCOUNT_PERCENTAGE,
-                    LOAD_DATE
-                ) VALUES (
-                    SEQ_TRANSACTION_ID.NEXTVAL,
-                    :1, :2, :3, :4, :5, :6, :7, :8, SYSDATE
-                )
-            """
-            
-            # Prepare data tuples
-            data_tuples = [
-                (
-                    row['transaction_date'],
-                    int(row['customer_id']),
-                    int(row['product_id']),
-                    float(row['quantity']),
-                    float(row['unit_price']),
-                    float(row['total_amount']),
-                    int(row.get('region_id', 0)) if pd.notna(row.get('region_id')) else None,
-                    float(row.get('discount_percentage', 0))
-                )
-                for _, row in df.iterrows()
-            ]
-            
-            db.execute_batch_insert(insert_query, data_tuples)
+        # Stream CSV into Oracle, reading only needed columns with fixed dtypes
+        usecols = [col for col in CSV_COLUMNS if col in columns]
+        reader = pd.read_csv(
+            csv_path,
+            usecols=usecols,
+            dtype={col: CSV_DTYPES[col] for col in usecols if col in CSV_DTYPES},
+            parse_dates=['transaction_date'],
+            chunksize=self.chunk_size,
+            engine='c'
+        )
+        total = 0
+        with (nullcontext(db) if db is not None else OracleConnector()) as db:
+            for chunk in reader:
+                data_tuples = self._prepare_chunk(chunk)
+                db.execute_batch_insert(INSERT_QUERY, data_tuples,
+                                        input_sizes=INSERT_INPUT_SIZES, commit=False)
+                total += len(data_tuples)
+            db.commit()
         
-        logger.info(f"Successfully loaded {len(df)} records into Oracle")
+        logger.info(f"Successfully loaded {total} records into Oracle")
         
         # Archive file
         archive_path = Path(self.config['paths']['archive_data'])
@@ -104,5 +126,38 @@ class CSVLoader:
         csv_path.rename(archive_file)
         logger.info(f"Archived file to: {archive_file}")
         
-        return len(df)
-
+        return total
+    
+    @staticmethod
+    def _prepare_chunk(df):
+        """
+        Clean a CSV chunk and build insert tuples column-wise
+        
+        Args:
+            df: DataFrame chunk
+            
+        Returns:
+            list: Tuples in INSERT_QUERY bind order
+        """
+        # region_id stays nullable: blank regions are loaded as NULL
+        if 'region_id' in df.columns:
+            region_id = df['region_id'].astype('Int64')
+        else:
+            region_id = pd.Series(pd.NA, index=df.index, dtype='Int64')
+        
+        df = df.drop(columns='region_id', errors='ignore').fillna(0)
+        discount = df['discount_percentage'] if 'discount_percentage' in df.columns \
+            else pd.Series(0.0, index=df.index)
+        
+        # One list per column, zipped in C; no per-row objects besides the tuples
+        columns = [
+            df['transaction_date'].dt.to_pydatetime().tolist(),
+            df['customer_id'].astype('int64').tolist(),
+            df['product_id'].astype('int64').tolist(),
+            df['quantity'].astype('float64').tolist(),
+            df['unit_price'].astype('float64').tolist(),
+            df['total_amount'].astype('float64').tolist(),
+            region_id.astype(object).where(region_id.notna(), None).tolist(),
+            discount.astype('float64').tolist()
+        ]
+        return list(zip(*columns))
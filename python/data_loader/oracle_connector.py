@@ -2,12 +2,62 @@
 Oracle Database Connection Handler
 """
 
+import threading
+import time
 import cx_Oracle
-from python.utils.config_loader import load_config, get_db_connection_string
+import pandas as pd
+from python.utils.config_loader import load_config
 from python.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Read-only query results keyed by (query, params): {key: (timestamp, rows)}
+_QUERY_CACHE = {}
+
+
+def clear_query_cache():
+    """Invalidate all cached query results"""
+    _QUERY_CACHE.clear()
+
+
+# Process-wide session pool, created on first connect
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool(config):
+    """
+    Get (lazily creating) the shared Oracle session pool
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        cx_Oracle.SessionPool: Session pool
+    """
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            # Re-check: another thread may have created it while we waited
+            if _POOL is None:
+                db_config = config['database']
+                pool_config = db_config.get('pool', {})
+                pool = cx_Oracle.SessionPool(
+                    user=db_config['username'],
+                    password=db_config['password'],
+                    dsn=f"{db_config['host']}:{db_config['port']}/{db_config['service_name']}",
+                    min=pool_config.get('min', 2),
+                    max=pool_config.get('max', 10),
+                    increment=pool_config.get('increment', 1),
+                    getmode=cx_Oracle.SPOOL_ATTRVAL_WAIT,
+                    threaded=True
+                )
+                # Keep parsed statements (e.g. the sales INSERT) cached per session
+                pool.stmtcachesize = pool_config.get('stmtcachesize', 50)
+                _POOL = pool
+                logger.info("Created Oracle session pool")
+    return _POOL
+
 
 class OracleConnector:
     """Oracle database connection manager"""
@@ -22,13 +72,17 @@ class OracleConnector:
         self.config = load_config(config_path)
         self.connection = None
         self.cursor = None
+        self._pool = None
     
     def connect(self):
         """Establish database connection"""
         try:
-            conn_string = get_db_connection_string(self.config)
-            self.connection = cx_Oracle.connect(conn_string)
+            self._pool = get_pool(self.config)
+            self.connection = self._pool.acquire()
+            self.connection.autocommit = False
             self.cursor = self.connection.cursor()
+            self.cursor.arraysize = 10000
+            self.cursor.prefetchrows = 10001
             logger.info("Successfully connected to Oracle database")
         except Exception as e:
             logger.error(f"Failed to connect to Oracle database: {str(e)}")
@@ -39,67 +93,155 @@ class OracleConnector:
         if self.cursor:
             self.cursor.close()
         if self.connection:
-            self.connection.close()
-            logger.info("Disconnected from Oracle database")
+            self._pool.release(self.connection)
+            self.connection = None
+            logger.info("Released Oracle connection to pool")
     
-    def execute_query(self, query, params=None):
+    def execute_query(self, query, params=None, cache=False, ttl=300):
         """
         Execute SELECT query
         
         Args:
             query: SQL query string
             params: Query parameters (dict)
+            cache: Serve/store the result in the in-memory query cache
+            ttl: Seconds a cached result stays valid
             
         Returns:
             list: Query results
         """
+        if cache:
+            key = (query, tuple(sorted((params or {}).items())))
+            cached = _QUERY_CACHE.get(key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return list(cached[1])
+        
         try:
             if params:
                 self.cursor.execute(query, params)
             else:
                 self.cursor.execute(query)
-            return self.cursor.fetchall()
+            results = self.cursor.fetchall()
         except Exception as e:
             logger.error(f"Query execution failed: {str(e)}")
             raise
+        
+        if cache:
+            _QUERY_CACHE[key] = (time.monotonic(), results)
+            return list(results)
+        return results
     
-    def execute_procedure(self, procedure_name, params=None):
+    def iter_query(self, query, params=None, batch_size=5000):
+        """
+        Execute SELECT query and yield its rows in batches
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (dict)
+            batch_size: Rows fetched per round trip
+            
+        Yields:
+            list: Up to batch_size result rows
+        """
+        arraysize = self.cursor.arraysize
+        try:
+            self.cursor.arraysize = batch_size
+            if params:
+                self.cursor.execute(query, params)
+            else:
+                self.cursor.execute(query)
+            while True:
+                rows = self.cursor.fetchmany()
+                if not rows:
+                    break
+                yield rows
+        except Exception as e:
+            logger.error(f"Query execution failed: {str(e)}")
+            raise
+        finally:
+            self.cursor.arraysize = arraysize
+    
+    def execute_df(self, query, params=None, batch_size=5000):
+        """
+        Execute SELECT query into a DataFrame
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (dict)
+            batch_size: Rows fetched per round trip
+            
+        Returns:
+            pd.DataFrame: Query results with the cursor's column names
+        """
+        arraysize = self.cursor.arraysize
+        try:
+            self.cursor.arraysize = batch_size
+            if params:
+                self.cursor.execute(query, params)
+            else:
+                self.cursor.execute(query)
+            columns = [desc[0] for desc in self.cursor.description]
+            return pd.DataFrame(self.cursor.fetchall(), columns=columns)
+        except Exception as e:
+            logger.error(f"Query execution failed: {str(e)}")
+            raise
+        finally:
+            self.cursor.arraysize = arraysize
+    
+    def execute_procedure(self, procedure_name, params=None, auto_commit=True):
         """
         Execute PL/SQL procedure
         
         Args:
             procedure_name: Procedure name
             params: Procedure parameters (dict)
+            auto_commit: Commit after the call; pass False to run several
+                procedures under a single commit()
         """
         try:
             if params:
                 self.cursor.callproc(procedure_name, list(params.values()))
             else:
                 self.cursor.callproc(procedure_name)
-            self.connection.commit()
+            if auto_commit:
+                self.commit()
             logger.info(f"Successfully executed procedure: {procedure_name}")
         except Exception as e:
             logger.error(f"Procedure execution failed: {str(e)}")
             self.connection.rollback()
             raise
     
-    def execute_batch_insert(self, query, data):
+    def execute_batch_insert(self, query, data, batch_size=10000, input_sizes=None, commit=True):
         """
         Execute batch insert
         
         Args:
             query: INSERT query string
             data: List of tuples to insert
+            batch_size: Number of rows sent per executemany round-trip
+            input_sizes: Optional bind types passed to cursor.setinputsizes
+            commit: Commit after inserting; pass False to batch several
+                inserts under a single commit()
         """
         try:
-            self.cursor.executemany(query, data)
-            self.connection.commit()
+            if input_sizes:
+                self.cursor.setinputsizes(*input_sizes)
+            for i in range(0, len(data), batch_size):
+                self.cursor.executemany(query, data[i:i + batch_size],
+                                        batcherrors=False, arraydmlrowcounts=False)
+            if commit:
+                self.commit()
             logger.info(f"Successfully inserted {len(data)} records")
         except Exception as e:
             logger.error(f"Batch insert failed: {str(e)}")
             self.connection.rollback()
             raise
     
+    def commit(self):
+        """Commit the current transaction and invalidate cached reads"""
+        self.connection.commit()
+        clear_query_cache()
+    
     def __enter__(self):
         """Context manager entry"""
         self.connect()
@@ -10,20 +10,56 @@ import numpy as np
 from datetime import datetime, timedelta
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+import matplotlib.pyplot as plt
+import seaborn as sns
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from python.utils.logger import setup_logger
-from python.visualization.chart_generator import ChartGenerator
+from python.visualization.chart_generator import ChartGenerator, get_plotly
 from python.visualization.report_generator import ReportGenerator
 
 logger = setup_logger(__name__, 'logs/demo.log')
 
+try:
+    import numba
+except ImportError:  # numba is optional; fall back to the NumPy path
+    numba = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; fall back to pandas
+    pa = None
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _gen_sales(cust_regions, prod_prices, price_jitter, cust_idx, prod_idx, quantity, discount):
+        """Fused per-transaction price, amount and region computation"""
+        n = cust_idx.shape[0]
+        unit_price = np.empty(n)
+        total_amount = np.empty(n)
+        region_ids = np.empty(n, np.int8)
+        for i in numba.prange(n):
+            price = prod_prices[prod_idx[i]] * (0.8 + price_jitter[i] * 0.4)  # 20% variance
+            unit_price[i] = price
+            total_amount[i] = quantity[i] * price * (1 - discount[i] / 100)
+            region_ids[i] = cust_regions[cust_idx[i]]
+        return unit_price, total_amount, region_ids
+else:
+    _gen_sales = None
+
 
 class DemoDataGenerator:
     """Generate demo data for testing without Oracle"""
     
+    # Discount distribution: mostly no discount
+    _DISCOUNT_VALUES = np.array([0, 5, 10], dtype=np.int8)
+    _DISCOUNT_PROBS = np.array([0.6, 0.2, 0.2])
+    
     def __init__(self):
         self.regions = [
             {'REGION_ID': 1, 'REGION_NAME': 'North America', 'REGION_CODE': 'NA'},
@@ -52,89 +88,121 @@ class DemoDataGenerator:
             {'PRODUCT_ID': 104, 'PRODUCT_NAME': 'Hardware Equipment', 'CATEGORY': 'Hardware', 'UNIT_PRICE': 2000},
             {'PRODUCT_ID': 105, 'PRODUCT_NAME': 'Support Package', 'CATEGORY': 'Services', 'UNIT_PRICE': 300}
         ]
+        
+        # Column (SoA) views of the lookup tables for vectorized sampling
+        self._cust_arr = np.array([c['CUSTOMER_ID'] for c in self.customers], dtype=np.int32)
+        self._cust_region = np.array([c['REGION_ID'] for c in self.customers], dtype=np.int8)
+        self._prod_ids = np.array([p['PRODUCT_ID'] for p in self.products], dtype=np.int32)
+        self._prod_prices = np.array([p['UNIT_PRICE'] for p in self.products], dtype=np.float32)
     
     def generate_sales_data(self, num_days=90):
         """Generate sample sales transactions"""
-        transactions = []
+        rng = np.random.default_rng(42)  # For reproducibility
         start_date = datetime.now() - timedelta(days=num_days)
         
-        np.random.seed(42)  # For reproducibility
-        
-        for day in range(num_days):
-            date = start_date + timedelta(days=day)
-            num_transactions = np.random.randint(5, 20)
-            
-            for _ in range(num_transactions):
-                customer = np.random.choice(self.customers)
-                product = np.random.choice(self.products)
-                region_id = customer['REGION_ID']
-                quantity = np.random.randint(1, 50)
-                unit_price = product['UNIT_PRICE'] * (0.8 + np.random.random() * 0.4)  # 20% variance
-                discount = np.random.choice([0, 0, 0, 5, 10])  # Mostly no discount
-                total_amount = quantity * unit_price * (1 - discount / 100)
-                
-                transactions.append({
-                    'TRANSACTION_DATE': date,
-                    'CUSTOMER_ID': customer['CUSTOMER_ID'],
-                    'PRODUCT_ID': product['PRODUCT_ID'],
-                    'QUANTITY': quantity,
-                    'UNIT_PRICE': unit_price,
-                    'TOTAL_AMOUNT': total_amount,
-                    'REGION_ID': region_id,
-                    'DISCOUNT_PERCENTAGE': discount
-                })
-        
-        return pd.DataFrame(transactions)
+        # Transactions per day, expanded to one date per transaction
+        counts = rng.integers(5, 20, num_days)
+        days = pd.Timestamp(start_date) + pd.to_timedelta(np.arange(num_days), unit='D')
+        total_txn = int(counts.sum())
+        
+        cust_idx = rng.integers(0, len(self._cust_arr), total_txn)
+        prod_idx = rng.integers(0, len(self._prod_ids), total_txn)
+        quantity = rng.integers(1, 50, total_txn)
+        price_jitter = rng.random(total_txn)
+        discount = rng.choice(self._DISCOUNT_VALUES, size=total_txn, p=self._DISCOUNT_PROBS)
+        
+        if _gen_sales is not None:
+            unit_price, total_amount, region_ids = _gen_sales(
+                self._cust_region, self._prod_prices, price_jitter,
+                cust_idx, prod_idx, quantity, discount
+            )
+        else:
+            unit_price = self._prod_prices[prod_idx] * (0.8 + price_jitter * 0.4)  # 20% variance
+            total_amount = quantity * unit_price * (1 - discount / 100)
+            region_ids = self._cust_region[cust_idx]
+        
+        return pd.DataFrame({
+            'TRANSACTION_DATE': np.repeat(days.values, counts),
+            'CUSTOMER_ID': self._cust_arr[cust_idx].astype(np.int8),
+            'PRODUCT_ID': self._prod_ids[prod_idx].astype(np.int16),
+            'QUANTITY': quantity.astype(np.int8),
+            'UNIT_PRICE': unit_price.astype(np.float32),
+            'TOTAL_AMOUNT': total_amount.astype(np.float32),
+            'REGION_ID': region_ids,
+            'DISCOUNT_PERCENTAGE': discount
+        })
     
     def generate_kpi_results(self, sales_df):
         """Generate KPI results from sales data"""
-        kpi_results = []
-        
-        # Revenue by Region
-        revenue_by_region = sales_df.groupby(['REGION_ID', sales_df['TRANSACTION_DATE'].dt.date])['TOTAL_AMOUNT'].sum().reset_index()
-        for _, row in revenue_by_region.iterrows():
-            kpi_results.append({
-                'KPI_NAME': 'REVENUE_BY_REGION',
-                'KPI_VALUE': row['TOTAL_AMOUNT'],
-                'KPI_DATE': row['TRANSACTION_DATE'],
-                'REGION_ID': int(row['REGION_ID']),
-                'CALCULATION_DATE': datetime.now()
-            })
+        now = pd.Timestamp(datetime.now())
+        
+        # Small-integer group codes, aggregated with np.bincount
+        amount = sales_df['TOTAL_AMOUNT'].to_numpy(dtype=np.float64)
+        day = sales_df['TRANSACTION_DATE'].to_numpy().astype('datetime64[D]')
+        days, day_idx = np.unique(day, return_inverse=True)
+        day_counts = np.bincount(day_idx, minlength=len(days))
+        day_totals = np.bincount(day_idx, weights=amount, minlength=len(days))
+        
+        # Revenue by Region (per region and day, observed pairs only)
+        regions, region_idx = np.unique(sales_df['REGION_ID'].to_numpy(), return_inverse=True)
+        pair = region_idx * len(days) + day_idx
+        pair_totals = np.bincount(pair, weights=amount, minlength=len(regions) * len(days))
+        observed = np.flatnonzero(np.bincount(pair, minlength=len(pair_totals)))
         
         # Monthly Revenue Trend
-        monthly_revenue = sales_df.groupby(sales_df['TRANSACTION_DATE'].dt.to_period('M'))['TOTAL_AMOUNT'].sum()
-        for period, value in monthly_revenue.items():
-            kpi_results.append({
-                'KPI_NAME': 'MONTHLY_REVENUE_TREND',
-                'KPI_VALUE': value,
-                'KPI_DATE': period.to_timestamp(),
-                'REGION_ID': None,
-                'CALCULATION_DATE': datetime.now()
-            })
+        months, month_idx = np.unique(day.astype('datetime64[M]'), return_inverse=True)
+        month_totals = np.bincount(month_idx, weights=amount, minlength=len(months))
         
         # Top Customers
-        top_customers = sales_df.groupby('CUSTOMER_ID')['TOTAL_AMOUNT'].sum().nlargest(10)
-        for customer_id, value in top_customers.items():
-            kpi_results.append({
-                'KPI_NAME': 'TOP_CUSTOMERS',
-                'KPI_VALUE': value,
-                'KPI_DATE': datetime.now().date(),
-                'REGION_ID': None,
-                'CALCULATION_DATE': datetime.now()
-            })
+        customer_ids = sales_df['CUSTOMER_ID'].to_numpy()
+        customer_totals = np.bincount(customer_ids, weights=amount)
+        present = np.flatnonzero(np.bincount(customer_ids))
+        top_customers = present[np.argsort(-customer_totals[present], kind='stable')[:10]]
         
         # Average Transaction Value
-        daily_avg = sales_df.groupby(sales_df['TRANSACTION_DATE'].dt.date)['TOTAL_AMOUNT'].mean()
-        for date, value in daily_avg.items():
-            kpi_results.append({
-                'KPI_NAME': 'AVG_TRANSACTION_VALUE',
-                'KPI_VALUE': value,
-                'KPI_DATE': date,
-                'REGION_ID': None,
-                'CALCULATION_DATE': datetime.now()
-            })
+        daily_avg = day_totals / day_counts
+        
+        # All KPI_DATE values are midnight datetime64[ns], so the column
+        # has one type across KPIs
+        kpis = [
+            ('REVENUE_BY_REGION', pair_totals[observed],
+             days[observed % len(days)], regions[observed // len(days)]),
+            ('MONTHLY_REVENUE_TREND', month_totals, months, None),
+            ('TOP_CUSTOMERS', customer_totals[top_customers],
+             np.full(len(top_customers), now.normalize().to_datetime64()), None),
+            ('AVG_TRANSACTION_VALUE', daily_avg, days, None)
+        ]
+        
+        if pa is not None:
+            # Columnar Arrow tables, concatenated without copying and
+            # converted to pandas once
+            tables = [self._kpi_table(*kpi, now) for kpi in kpis]
+            return pa.concat_tables(tables).to_pandas(split_blocks=True)
         
-        return pd.DataFrame(kpi_results)
+        return pd.concat([self._kpi_frame(*kpi, now) for kpi in kpis], ignore_index=True)
+    
+    @staticmethod
+    def _kpi_table(kpi_name, values, dates, region_ids, calculation_date):
+        """Build a KPI_RESULTS-shaped Arrow table for one KPI from column arrays"""
+        n = len(values)
+        return pa.table({
+            'KPI_NAME': pa.array([kpi_name] * n, type=pa.string()).dictionary_encode(),
+            'KPI_VALUE': pa.array(values, type=pa.float64()),
+            'KPI_DATE': pa.array(dates.astype('datetime64[ns]'), type=pa.timestamp('ns')),
+            'REGION_ID': pa.array(region_ids if region_ids is not None else [None] * n, type=pa.float64()),
+            'CALCULATION_DATE': pa.array([calculation_date] * n, type=pa.timestamp('ns'))
+        })
+    
+    @staticmethod
+    def _kpi_frame(kpi_name, values, dates, region_ids, calculation_date):
+        """Build KPI_RESULTS-shaped rows for one KPI from column arrays"""
+        return pd.DataFrame({
+            'KPI_NAME': kpi_name,
+            'KPI_VALUE': values,
+            'KPI_DATE': dates.astype('datetime64[ns]'),
+            'REGION_ID': region_ids if region_ids is not None else np.nan,
+            'CALCULATION_DATE': calculation_date
+        })
 
 
 class DemoOracleConnector:
@@ -143,10 +211,23 @@ class DemoOracleConnector:
     def __init__(self, sales_df, kpi_df, regions, customers, products):
         self.sales_df = sales_df
         self.kpi_df = kpi_df
-        self.regions = pd.DataFrame(regions)
-        self.customers = pd.DataFrame(customers)
-        self.products = pd.DataFrame(products)
+        self.regions = pd.DataFrame(regions).astype({'REGION_NAME': 'category', 'REGION_CODE': 'category'})
+        self.customers = pd.DataFrame(customers).astype({'CUSTOMER_NAME': 'category'})
+        self.products = pd.DataFrame(products).astype({'PRODUCT_NAME': 'category', 'CATEGORY': 'category'})
+        # Lookups are static, so sales are joined to their names once
+        self.sales_enriched = (
+            sales_df
+            .merge(self.regions[['REGION_ID', 'REGION_NAME']], on='REGION_ID', how='left')
+            .merge(self.customers[['CUSTOMER_ID', 'CUSTOMER_NAME']], on='CUSTOMER_ID', how='left')
+            .merge(self.products[['PRODUCT_ID', 'PRODUCT_NAME', 'CATEGORY']], on='PRODUCT_ID', how='left')
+        )
         self.connection = True  # Mock connection
+        # KPI rows split once by name instead of boolean-mask scans per lookup
+        self.kpi_by_name = {
+            name: group for name, group in kpi_df.groupby('KPI_NAME', sort=False, observed=True)
+        }
+        # Fixture data is static, so results are memoized by (query, params)
+        self._cache = {}
     
     def __enter__(self):
         return self
@@ -154,65 +235,293 @@ class DemoOracleConnector:
     def __exit__(self, *args):
         pass
     
+    def kpi_rows(self, kpi_name):
+        """Return the KPI_RESULTS rows for one KPI name (empty if none)"""
+        return self.kpi_by_name.get(kpi_name, self.kpi_df.iloc[0:0])
+    
     def execute_query(self, query, params=None):
-        """Mock query execution"""
+        """Mock query execution (memoized)"""
+        key = (query, tuple(sorted((params or {}).items())))
+        if key not in self._cache:
+            self._cache[key] = self._run_query(query, params)
+        return list(self._cache[key])
+    
+    def _run_query(self, query, params=None):
+        """Route a query to the matching pandas computation"""
         # Parse simple queries and return mock data
         if 'REGIONS' in query and ('REVENUE_BY_REGION' in query or 'REGION_NAME' in query):
             # Revenue by region query
-            result_df = self.kpi_df[self.kpi_df['KPI_NAME'] == 'REVENUE_BY_REGION'].copy()
+            result_df = self.kpi_rows('REVENUE_BY_REGION')
             if len(result_df) > 0:
                 result_df = result_df.merge(self.regions, on='REGION_ID', how='left')
-                result_df = result_df.groupby('REGION_NAME')['KPI_VALUE'].sum().reset_index()
+                result_df = result_df.groupby('REGION_NAME', observed=True)['KPI_VALUE'].sum().reset_index()
                 result_df.columns = ['REGION_NAME', 'TOTAL_REVENUE']
-                return [tuple(row) for row in result_df.values]
+                return list(zip(result_df['REGION_NAME'].to_numpy(), result_df['TOTAL_REVENUE'].to_numpy()))
             else:
                 # Fallback: calculate from sales data
-                region_revenue = self.sales_df.groupby('REGION_ID')['TOTAL_AMOUNT'].sum().reset_index()
-                region_revenue = region_revenue.merge(self.regions, on='REGION_ID', how='left')
-                region_revenue = region_revenue[['REGION_NAME', 'TOTAL_AMOUNT']]
-                region_revenue.columns = ['REGION_NAME', 'TOTAL_REVENUE']
-                return [tuple(row) for row in region_revenue.values]
+                region_revenue = self.sales_enriched.groupby('REGION_NAME', observed=True)['TOTAL_AMOUNT'].sum()
+                return list(zip(region_revenue.index.to_numpy(), region_revenue.to_numpy()))
         
         elif 'MONTHLY_REVENUE_TREND' in query:
-            result_df = self.kpi_df[self.kpi_df['KPI_NAME'] == 'MONTHLY_REVENUE_TREND'].copy()
+            result_df = self.kpi_rows('MONTHLY_REVENUE_TREND')
             if len(result_df) > 0:
                 result_df = result_df.sort_values('KPI_DATE')
-                return [(row['KPI_DATE'], row['KPI_VALUE']) for _, row in result_df.iterrows()]
+                return list(zip(result_df['KPI_DATE'].to_numpy().astype('datetime64[ns]'), result_df['KPI_VALUE'].to_numpy()))
             else:
                 # Fallback: calculate from sales data
                 monthly_revenue = self.sales_df.groupby(self.sales_df['TRANSACTION_DATE'].dt.to_period('M'))['TOTAL_AMOUNT'].sum()
                 return [(period.to_timestamp(), value) for period, value in monthly_revenue.items()]
         
         elif 'TOP_CUSTOMERS' in query or 'CUSTOMER_NAME' in query:
-            # Top customers query - get customer revenue and match with customer names
-            customer_revenue = self.sales_df.groupby('CUSTOMER_ID')['TOTAL_AMOUNT'].sum().reset_index()
-            customer_revenue = customer_revenue.merge(self.customers, on='CUSTOMER_ID', how='left')
-            customer_revenue = customer_revenue.nlargest(10, 'TOTAL_AMOUNT')
-            return [(row['CUSTOMER_NAME'], row['TOTAL_AMOUNT']) for _, row in customer_revenue.iterrows()]
+            # Top customers query - revenue grouped on the pre-joined customer names
+            customer_revenue = self.sales_enriched.groupby('CUSTOMER_NAME', observed=True)['TOTAL_AMOUNT'].sum()
+            customer_revenue = customer_revenue.nlargest(10)
+            return list(zip(customer_revenue.index.to_numpy(), customer_revenue.to_numpy()))
         
         elif 'KPI_RESULTS' in query and 'KPI_NAME' in query:
             # Generic KPI results query
             kpi_name = params.get('kpi_name', '') if params else ''
-            result_df = self.kpi_df[self.kpi_df['KPI_NAME'] == kpi_name].copy() if kpi_name else self.kpi_df.copy()
-            return [(row['KPI_ID'] if 'KPI_ID' in row else 0, 
-                    row['KPI_NAME'], 
-                    row['KPI_VALUE'], 
-                    row['KPI_DATE'], 
-                    row['REGION_ID'], 
-                    row['CALCULATION_DATE']) for _, row in result_df.iterrows()]
+            result_df = self.kpi_rows(kpi_name) if kpi_name else self.kpi_df
+            kpi_ids = result_df['KPI_ID'].to_numpy() if 'KPI_ID' in result_df.columns else np.zeros(len(result_df), dtype=int)
+            return list(zip(kpi_ids,
+                            result_df['KPI_NAME'].to_numpy(),
+                            result_df['KPI_VALUE'].to_numpy(),
+                            result_df['KPI_DATE'].to_numpy(),
+                            result_df['REGION_ID'].to_numpy(),
+                            result_df['CALCULATION_DATE'].to_numpy()))
         
         elif 'SUM(KPI_VALUE)' in query and 'MONTHLY_REVENUE_TREND' in query:
-            total = self.kpi_df[self.kpi_df['KPI_NAME'] == 'MONTHLY_REVENUE_TREND']['KPI_VALUE'].sum()
+            total = self.kpi_rows('MONTHLY_REVENUE_TREND')['KPI_VALUE'].sum()
             return [(total,)]
         
         elif 'AVG(KPI_VALUE)' in query and 'AVG_TRANSACTION_VALUE' in query:
-            avg = self.kpi_df[self.kpi_df['KPI_NAME'] == 'AVG_TRANSACTION_VALUE']['KPI_VALUE'].mean()
+            avg = self.kpi_rows('AVG_TRANSACTION_VALUE')['KPI_VALUE'].mean()
             return [(avg,)]
         
         else:
             return []
 
 
+CSV_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _write_csv(df, csv_file):
+    """Write a DataFrame to CSV with PyArrow's C++ writer, or pandas as fallback"""
+    if pa is None:
+        df.to_csv(csv_file, index=False, lineterminator='\n', date_format=CSV_DATE_FORMAT)
+        return
+    # Write timestamps in the fallback's format. The files still differ in quoting and
+    # float text: pyarrow quotes string values and writes 1 where pandas writes 1.0
+    date_cols = df.select_dtypes(include=['datetime', 'datetimetz']).columns
+    if len(date_cols):
+        df = df.assign(**{col: df[col].dt.strftime(CSV_DATE_FORMAT) for col in date_cols})
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(csv_file))
+
+
+# Queries the demo charts issue against DemoOracleConnector
+REGION_REVENUE_QUERY = "SELECT r.REGION_NAME, SUM(k.KPI_VALUE) FROM KPI_RESULTS k JOIN REGIONS r"
+MONTHLY_TREND_QUERY = "SELECT KPI_DATE, KPI_VALUE FROM KPI_RESULTS WHERE KPI_NAME = 'MONTHLY_REVENUE_TREND'"
+TOP_CUSTOMERS_QUERY = "SELECT c.CUSTOMER_NAME, k.KPI_VALUE"
+DASHBOARD_REGION_QUERY = "SELECT r.REGION_NAME, SUM(k.KPI_VALUE)"
+DASHBOARD_TREND_QUERY = "SELECT KPI_DATE, KPI_VALUE FROM KPI_RESULTS"
+
+
+def _render_revenue_chart(results, charts_path):
+    """Render the revenue by region chart from query results"""
+    if not results:
+        logger.warning("No data found for revenue by region")
+        return
+    df = pd.DataFrame(results, columns=['REGION_NAME', 'TOTAL_REVENUE'])
+    plt.figure(figsize=(10, 6), tight_layout=True)
+    plt.bar(df['REGION_NAME'], df['TOTAL_REVENUE'], color='steelblue')
+    plt.title('Revenue by Region', fontsize=16, fontweight='bold')
+    plt.xlabel('Region', fontsize=12)
+    plt.ylabel('Total Revenue', fontsize=12)
+    plt.xticks(rotation=45)
+    chart_file = charts_path / 'revenue_by_region.png'
+    plt.savefig(chart_file, dpi=120, bbox_inches='tight')
+    plt.close()
+    logger.info(f"Saved chart: {chart_file}")
+
+
+def _render_trend_chart(results, charts_path):
+    """Render the monthly revenue trend chart from query results"""
+    if not results:
+        logger.warning("No data found for monthly trend")
+        return
+    df = pd.DataFrame(results, columns=['KPI_DATE', 'KPI_VALUE'])
+    plt.figure(figsize=(12, 6), tight_layout=True)
+    sns.lineplot(data=df, x='KPI_DATE', y='KPI_VALUE', marker='o', linewidth=2)
+    plt.title('Monthly Revenue Trend', fontsize=16, fontweight='bold')
+    plt.xlabel('Month', fontsize=12)
+    plt.ylabel('Revenue', fontsize=12)
+    plt.xticks(rotation=45)
+    plt.grid(True, alpha=0.3)
+    chart_file = charts_path / 'monthly_revenue_trend.png'
+    plt.savefig(chart_file, dpi=120, bbox_inches='tight')
+    plt.close()
+    logger.info(f"Saved chart: {chart_file}")
+
+
+def _render_customers_chart(results, charts_path, top_n=10):
+    """Render the top customers chart from query results"""
+    if not results:
+        logger.warning("No data found for top customers")
+        return
+    df = pd.DataFrame(results, columns=['CUSTOMER_NAME', 'REVENUE'])
+    plt.figure(figsize=(10, 8), tight_layout=True)
+    plt.barh(df['CUSTOMER_NAME'], df['REVENUE'], color='coral')
+    plt.title(f'Top {top_n} Customers by Revenue', fontsize=16, fontweight='bold')
+    plt.xlabel('Revenue', fontsize=12)
+    plt.ylabel('Customer', fontsize=12)
+    chart_file = charts_path / 'top_customers.png'
+    plt.savefig(chart_file, dpi=120, bbox_inches='tight')
+    plt.close()
+    logger.info(f"Saved chart: {chart_file}")
+
+
+def _render_dashboard(region_data, trend_data, charts_path):
+    """Render the interactive Plotly dashboard from query results"""
+    go, make_subplots = get_plotly()
+    
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Revenue by Region', 'Monthly Revenue Trend'),
+        specs=[[{"type": "bar"}], [{"type": "scatter"}]]
+    )
+    
+    if region_data:
+        df_regions = pd.DataFrame(region_data, columns=['REGION_NAME', 'TOTAL_REVENUE'])
+        fig.add_trace(
+            go.Bar(x=df_regions['REGION_NAME'], y=df_regions['TOTAL_REVENUE'],
+                  name='Revenue', marker_color='steelblue'),
+            row=1, col=1
+        )
+    
+    if trend_data:
+        df_trend = pd.DataFrame(trend_data, columns=['KPI_DATE', 'KPI_VALUE'])
+        fig.add_trace(
+            go.Scatter(x=df_trend['KPI_DATE'], y=df_trend['KPI_VALUE'],
+                     mode='lines+markers', name='Revenue Trend',
+                     line=dict(color='coral', width=2)),
+            row=2, col=1
+        )
+    
+    fig.update_layout(height=800, title_text="Sales Analytics Dashboard", showlegend=True)
+    dashboard_file = charts_path / 'interactive_dashboard.html'
+    fig.write_html(str(dashboard_file), include_plotlyjs='cdn', full_html=True, validate=False)
+    logger.info(f"Saved interactive dashboard: {dashboard_file}")
+
+
+class DemoChartGenerator(ChartGenerator):
+    """Chart generator backed by DemoOracleConnector"""
+    
+    def __init__(self, db, config_path='config.yaml'):
+        """
+        Initialize demo chart generator
+        
+        Args:
+            db: DemoOracleConnector serving the demo data
+            config_path: Path to configuration file
+        """
+        super().__init__(config_path)
+        self.db = db
+    
+    def plot_revenue_by_region(self, start_date=None, end_date=None):
+        """Generate revenue by region chart"""
+        _render_revenue_chart(self.db.execute_query(REGION_REVENUE_QUERY), self.charts_path)
+    
+    def plot_monthly_trend(self):
+        """Generate monthly revenue trend chart"""
+        _render_trend_chart(self.db.execute_query(MONTHLY_TREND_QUERY), self.charts_path)
+    
+    def plot_top_customers(self, top_n=10):
+        """Generate top customers chart"""
+        _render_customers_chart(self.db.execute_query(TOP_CUSTOMERS_QUERY), self.charts_path, top_n)
+    
+    def create_interactive_dashboard(self):
+        """Create interactive Plotly dashboard"""
+        _render_dashboard(
+            self.db.execute_query(DASHBOARD_REGION_QUERY),
+            self.db.execute_query(DASHBOARD_TREND_QUERY),
+            self.charts_path
+        )
+
+
+class DemoReportGenerator(ReportGenerator):
+    """Report generator backed by DemoOracleConnector"""
+    
+    def __init__(self, db, config_path='config.yaml'):
+        """
+        Initialize demo report generator
+        
+        Args:
+            db: DemoOracleConnector serving the demo data
+            config_path: Path to configuration file
+        """
+        super().__init__(config_path)
+        self.insight_gen = None  # Skip insight generation for demo
+        self.db = db
+    
+    def generate_kpi_summary_csv(self):
+        """Generate CSV summary of all KPIs"""
+        csv_file = self.summaries_path / f'kpi_summary_{datetime.now().strftime("%Y%m%d")}.csv'
+        _write_csv(self.db.kpi_df, csv_file)
+        logger.info(f"Generated KPI summary CSV: {csv_file}")
+    
+    def generate_text_report(self, insights=None):
+        """Generate comprehensive text report"""
+        report_lines = []
+        report_lines.append("=" * 80)
+        report_lines.append("ENTERPRISE SALES ANALYTICS REPORT (DEMO MODE)")
+        report_lines.append("=" * 80)
+        report_lines.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        report_lines.append("")
+        
+        total_revenue = self.db.kpi_rows('MONTHLY_REVENUE_TREND')['KPI_VALUE'].sum()
+        report_lines.append(f"Total Revenue: ${total_revenue:,.2f}")
+        
+        region_revenue = self.db.kpi_rows('REVENUE_BY_REGION').groupby('REGION_ID')['KPI_VALUE'].sum()
+        region_names = self.db.regions.set_index('REGION_ID')['REGION_NAME']
+        report_lines.append("")
+        report_lines.append("Revenue by Region:")
+        report_lines.append("-" * 40)
+        for region_id, revenue in region_revenue.items():
+            region_name = region_names[region_id]
+            report_lines.append(f"  {region_name}: ${revenue:,.2f}")
+        
+        avg_trans = self.db.kpi_rows('AVG_TRANSACTION_VALUE')['KPI_VALUE'].mean()
+        report_lines.append("")
+        report_lines.append(f"Average Transaction Value: ${avg_trans:,.2f}")
+        
+        report_text = "\n".join(report_lines)
+        report_file = self.summaries_path / f'report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
+        with open(report_file, 'w', buffering=1 << 20, encoding='utf-8', newline='\n') as f:
+            f.write(report_text)
+        logger.info(f"Generated text report: {report_file}")
+        return report_text
+    
+    def generate_insight_file(self, insights=None):
+        """Generate standalone insight file"""
+        if insights is None:
+            insights = "Demo Mode: Sample insights generated\n"
+            insights += "Revenue trends are positive across all regions\n"
+            insights += "Top customers show consistent growth patterns"
+        
+        insight_file = self.insights_path / f'insights_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
+        insight_text = "".join([
+            "=" * 80 + "\n",
+            "AUTOMATED INSIGHTS REPORT (DEMO MODE)\n",
+            "=" * 80 + "\n",
+            f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            "\n",
+            insights
+        ])
+        with open(insight_file, 'w', buffering=1 << 20, encoding='utf-8', newline='\n') as f:
+            f.write(insight_text)
+        logger.info(f"Generated insight file: {insight_file}")
+
+
 def run_demo():
     """Run the application in demo mode"""
     logger.info("=" * 80)
@@ -242,212 +551,14 @@ def run_demo():
             data_gen.products
         )
         
-        # Monkey patch the ChartGenerator to use mock database
-        original_init = ChartGenerator.__init__
-        original_report_init = ReportGenerator.__init__
-        
-        def mock_chart_init(self, config_path='config.yaml'):
-            from python.utils.config_loader import load_config
-            from pathlib import Path
-            self.config = load_config(config_path)
-            self.charts_path = Path(self.config['paths']['reports_charts'])
-            self.charts_path.mkdir(parents=True, exist_ok=True)
-            self._mock_db = mock_db
-        
-        def mock_report_init(self, config_path='config.yaml'):
-            from python.utils.config_loader import load_config
-            from pathlib import Path
-            from python.analytics.insight_generator import InsightGenerator
-            self.config = load_config(config_path)
-            self.summaries_path = Path(self.config['paths']['reports_summaries'])
-            self.insights_path = Path(self.config['paths']['reports_insights'])
-            self.summaries_path.mkdir(parents=True, exist_ok=True)
-            self.insights_path.mkdir(parents=True, exist_ok=True)
-            self.insight_gen = None  # Skip insight generation for demo
-            self._mock_db = mock_db
-        
-        ChartGenerator.__init__ = mock_chart_init
-        ReportGenerator.__init__ = mock_report_init
-        
-        # Override execute_query in chart generator methods
-        original_plot_revenue = ChartGenerator.plot_revenue_by_region
-        original_plot_trend = ChartGenerator.plot_monthly_trend
-        original_plot_customers = ChartGenerator.plot_top_customers
-        original_create_dashboard = ChartGenerator.create_interactive_dashboard
-        
-        def mock_plot_revenue(self, start_date=None, end_date=None):
-            results = self._mock_db.execute_query("SELECT r.REGION_NAME, SUM(k.KPI_VALUE) FROM KPI_RESULTS k JOIN REGIONS r")
-            if not results:
-                logger.warning("No data found for revenue by region")
-                return
-            import pandas as pd
-            import matplotlib.pyplot as plt
-            df = pd.DataFrame(results, columns=['REGION_NAME', 'TOTAL_REVENUE'])
-            plt.figure(figsize=(10, 6))
-            plt.bar(df['REGION_NAME'], df['TOTAL_REVENUE'], color='steelblue')
-            plt.title('Revenue by Region', fontsize=16, fontweight='bold')
-            plt.xlabel('Region', fontsize=12)
-            plt.ylabel('Total Revenue', fontsize=12)
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            chart_file = self.charts_path / 'revenue_by_region.png'
-            plt.savefig(chart_file, dpi=300, bbox_inches='tight')
-            plt.close()
-            logger.info(f"Saved chart: {chart_file}")
-        
-        def mock_plot_trend(self):
-            results = self._mock_db.execute_query("SELECT KPI_DATE, KPI_VALUE FROM KPI_RESULTS WHERE KPI_NAME = 'MONTHLY_REVENUE_TREND'")
-            if not results:
-                logger.warning("No data found for monthly trend")
-                return
-            import pandas as pd
-            import seaborn as sns
-            import matplotlib.pyplot as plt
-            df = pd.DataFrame(results, columns=['KPI_DATE', 'KPI_VALUE'])
-            df['KPI_DATE'] = pd.to_datetime(df['KPI_DATE'])
-            plt.figure(figsize=(12, 6))
-            sns.lineplot(data=df, x='KPI_DATE', y='KPI_VALUE', marker='o', linewidth=2)
-            plt.title('Monthly Revenue Trend', fontsize=16, fontweight='bold')
-            plt.xlabel('Month', fontsize=12)
-            plt.ylabel('Revenue', fontsize=12)
-            plt.xticks(rotation=45)
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
-            chart_file = self.charts_path / 'monthly_revenue_trend.png'
-            plt.savefig(chart_file, dpi=300, bbox_inches='tight')
-            plt.close()
-            logger.info(f"Saved chart: {chart_file}")
-        
-        def mock_plot_customers(self, top_n=10):
-            results = self._mock_db.execute_query("SELECT c.CUSTOMER_NAME, k.KPI_VALUE")
-            if not results:
-                logger.warning("No data found for top customers")
-                return
-            import pandas as pd
-            import matplotlib.pyplot as plt
-            df = pd.DataFrame(results, columns=['CUSTOMER_NAME', 'REVENUE'])
-            plt.figure(figsize=(10, 8))
-            plt.barh(df['CUSTOMER_NAME'], df['REVENUE'], color='coral')
-            plt.title(f'Top {top_n} Customers by Revenue', fontsize=16, fontweight='bold')
-            plt.xlabel('Revenue', fontsize=12)
-            plt.ylabel('Customer', fontsize=12)
-            plt.tight_layout()
-            chart_file = self.charts_path / 'top_customers.png'
-            plt.savefig(chart_file, dpi=300, bbox_inches='tight')
-            plt.close()
-            logger.info(f"Saved chart: {chart_file}")
-        
-        def mock_create_dashboard(self):
-            import pandas as pd
-            import plotly.graph_objects as go
-            from plotly.subplots import make_subplots
-            
-            region_data = self._mock_db.execute_query("SELECT r.REGION_NAME, SUM(k.KPI_VALUE)")
-            trend_data = self._mock_db.execute_query("SELECT KPI_DATE, KPI_VALUE FROM KPI_RESULTS")
-            
-            fig = make_subplots(
-                rows=2, cols=1,
-                subplot_titles=('Revenue by Region', 'Monthly Revenue Trend'),
-                specs=[[{"type": "bar"}], [{"type": "scatter"}]]
-            )
-            
-            if region_data:
-                df_regions = pd.DataFrame(region_data, columns=['REGION_NAME', 'TOTAL_REVENUE'])
-                fig.add_trace(
-                    go.Bar(x=df_regions['REGION_NAME'], y=df_regions['TOTAL_REVENUE'],
-                          name='Revenue', marker_color='steelblue'),
-                    row=1, col=1
-                )
-            
-            if trend_data:
-                df_trend = pd.DataFrame(trend_data, columns=['KPI_DATE', 'KPI_VALUE'])
-                df_trend['KPI_DATE'] = pd.to_datetime(df_trend['KPI_DATE'])
-                fig.add_trace(
-                    go.Scatter(x=df_trend['KPI_DATE'], y=df_trend['KPI_VALUE'],
-                             mode='lines+markers', name='Revenue Trend',
-                             line=dict(color='coral', width=2)),
-                    row=2, col=1
-                )
-            
-            fig.update_layout(height=800, title_text="Sales Analytics Dashboard", showlegend=True)
-            dashboard_file = self.charts_path / 'interactive_dashboard.html'
-            fig.write_html(str(dashboard_file))
-            logger.info(f"Saved interactive dashboard: {dashboard_file}")
-        
-        ChartGenerator.plot_revenue_by_region = mock_plot_revenue
-        ChartGenerator.plot_monthly_trend = mock_plot_trend
-        ChartGenerator.plot_top_customers = mock_plot_customers
-        ChartGenerator.create_interactive_dashboard = mock_create_dashboard
-        
         # Generate charts
         logger.info("Step 3: Generating charts...")
-        chart_gen = ChartGenerator()
+        chart_gen = DemoChartGenerator(mock_db)
         chart_gen.generate_all_charts()
         
         # Generate reports
         logger.info("Step 4: Generating reports...")
-        report_gen = ReportGenerator()
-        
-        # Override report generation methods
-        def mock_generate_csv(self):
-            import pandas as pd
-            from datetime import datetime
-            df = self._mock_db.kpi_df.copy()
-            csv_file = self.summaries_path / f'kpi_summary_{datetime.now().strftime("%Y%m%d")}.csv'
-            df.to_csv(csv_file, index=False)
-            logger.info(f"Generated KPI summary CSV: {csv_file}")
-        
-        def mock_generate_text(self):
-            from datetime import datetime
-            report_lines = []
-            report_lines.append("=" * 80)
-            report_lines.append("ENTERPRISE SALES ANALYTICS REPORT (DEMO MODE)")
-            report_lines.append("=" * 80)
-            report_lines.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            report_lines.append("")
-            
-            total_revenue = self._mock_db.kpi_df[self._mock_db.kpi_df['KPI_NAME'] == 'MONTHLY_REVENUE_TREND']['KPI_VALUE'].sum()
-            report_lines.append(f"Total Revenue: ${total_revenue:,.2f}")
-            
-            region_revenue = self._mock_db.kpi_df[self._mock_db.kpi_df['KPI_NAME'] == 'REVENUE_BY_REGION'].groupby('REGION_ID')['KPI_VALUE'].sum()
-            report_lines.append("")
-            report_lines.append("Revenue by Region:")
-            report_lines.append("-" * 40)
-            for region_id, revenue in region_revenue.items():
-                region_name = self._mock_db.regions[self._mock_db.regions['REGION_ID'] == region_id]['REGION_NAME'].values[0]
-                report_lines.append(f"  {region_name}: ${revenue:,.2f}")
-            
-            avg_trans = self._mock_db.kpi_df[self._mock_db.kpi_df['KPI_NAME'] == 'AVG_TRANSACTION_VALUE']['KPI_VALUE'].mean()
-            report_lines.append("")
-            report_lines.append(f"Average Transaction Value: ${avg_trans:,.2f}")
-            
-            report_text = "\n".join(report_lines)
-            report_file = self.summaries_path / f'report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
-            with open(report_file, 'w') as f:
-                f.write(report_text)
-            logger.info(f"Generated text report: {report_file}")
-            return report_text
-        
-        def mock_generate_insights(self):
-            from datetime import datetime
-            insights = "Demo Mode: Sample insights generated\n"
-            insights += "Revenue trends are positive across all regions\n"
-            insights += "Top customers show consistent growth patterns"
-            
-            insight_file = self.insights_path / f'insights_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
-            with open(insight_file, 'w') as f:
-                f.write("=" * 80 + "\n")
-                f.write("AUTOMATED INSIGHTS REPORT (DEMO MODE)\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("\n")
-                f.write(insights)
-            logger.info(f"Generated insight file: {insight_file}")
-        
-        ReportGenerator.generate_kpi_summary_csv = mock_generate_csv
-        ReportGenerator.generate_text_report = mock_generate_text
-        ReportGenerator.generate_insight_file = mock_generate_insights
-        
+        report_gen = DemoReportGenerator(mock_db)
         report_gen.generate_all_reports()
         
         logger.info("=" * 80)
@@ -465,4 +576,3 @@ def run_demo():
 
 if __name__ == "__main__":
     run_demo()
-
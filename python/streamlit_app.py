@@ -5,6 +5,7 @@ Local, laptop-friendly dashboard for data exploration, KPIs, and charts.
 
 from __future__ import annotations
 
+import heapq
 import io
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +16,58 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+try:
+    import polars as pl
+except ImportError:  # polars is optional; KPI functions fall back to pandas
+    pl = None
+
+try:
+    import pyarrow  # noqa: F401  (enables pandas' multi-threaded CSV engine)
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
+
+try:
+    import numba
+except ImportError:  # numba is optional; outlier scoring falls back to NumPy
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _zscore_mask(x, threshold):
+        """Population z-scores and |z| > threshold mask in fused loops."""
+        n = x.shape[0]
+        total = 0.0
+        for i in range(n):
+            total += x[i]
+        mean = total / n
+        m2 = 0.0
+        for i in range(n):
+            d = x[i] - mean
+            m2 += d * d
+        std = np.sqrt(m2 / n)
+        z = np.empty(n)
+        mask = np.zeros(n, np.bool_)
+        if std == 0.0:
+            # Constant series: z is undefined and nothing is an outlier, as in the NumPy path
+            z[:] = np.nan
+            return z, mask
+        for i in range(n):
+            z[i] = (x[i] - mean) / std
+            mask[i] = abs(z[i]) > threshold
+        return z, mask
+else:
+    _zscore_mask = None
+
+# Bounds for caches holding whole frames; they are shared across sessions
+_FRAME_CACHE_ENTRIES = 8
+_FRAME_CACHE_TTL = 3600
+
+# Hash DataFrame arguments by content so cached results survive reruns
+_DF_HASH_FUNCS = {
+    pd.DataFrame: lambda d: (d.shape, int(pd.util.hash_pandas_object(d, index=False).sum()))
+}
+
 
 # -----------------------------
 # Data loading & preparation
@@ -30,62 +83,164 @@ def load_data(uploaded_file: io.BytesIO | None = None, filename: str | None = No
         if name.endswith((".xls", ".xlsx")):
             df = pd.read_excel(uploaded_file)
         else:
-            df = pd.read_csv(uploaded_file)
+            df = _read_csv(uploaded_file)
     else:
         sample_path = Path("data/input/sales_data_sample.csv")
         if sample_path.exists():
-            df = pd.read_csv(sample_path)
+            df = _read_csv(sample_path)
         else:
             df = generate_sample_data(800)
 
     # Light normalization to lower-case for convenience (keep originals too)
     df.columns = [str(c).strip() for c in df.columns]
+    return _shrink_dtypes(df)
+
+
+def _read_csv(source) -> pd.DataFrame:
+    """
+    Read a CSV with the PyArrow engine when installed.
+    Falls back to the C parser for files the Arrow reader rejects.
+    """
+    if _CSV_ENGINE == "pyarrow":
+        try:
+            return pd.read_csv(source, engine="pyarrow")
+        except ValueError:  # pyarrow.ArrowInvalid subclasses ValueError
+            if hasattr(source, "seek"):
+                source.seek(0)
+    return pd.read_csv(source)
+
+
+def _shrink_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast integer columns and dictionary-encode low-cardinality text columns.
+    Floats stay float64 so currency totals keep full precision.
+    """
+    for c in df.select_dtypes(include="integer").columns:
+        df[c] = pd.to_numeric(df[c], downcast="integer")
+    if len(df):
+        for c in df.select_dtypes(include="object").columns:
+            if df[c].nunique() / len(df) < 0.5:
+                df[c] = df[c].astype("category")
+    return df
+
+
+def concat_parts(parts: List[pd.DataFrame], names: List[str]) -> pd.DataFrame:
+    """
+    Stack uploaded files into one frame tagged with SOURCE_FILE.
+    Same-schema NumPy-typed parts are copied into preallocated columns;
+    anything else goes through pd.concat.
+    """
+    first = parts[0]
+    same_schema = all(
+        p.columns.equals(first.columns) and p.dtypes.equals(first.dtypes) for p in parts[1:]
+    ) and all(isinstance(dtype, np.dtype) for dtype in first.dtypes)
+    lengths = [len(p) for p in parts]
+    if not same_schema:
+        df = pd.concat(parts, ignore_index=True)
+    else:
+        total = sum(lengths)
+        out = {c: np.empty(total, dtype=first[c].dtype) for c in first.columns}
+        off = 0
+        for p, n in zip(parts, lengths):
+            for c in first.columns:
+                out[c][off:off + n] = p[c].to_numpy()
+            off += n
+        df = pd.DataFrame(out, copy=False)
+    df["SOURCE_FILE"] = np.repeat(names, lengths)
     return df
 
 
+@st.cache_data(show_spinner=False)
+def prepare(files: Tuple[Tuple[str, bytes], ...]) -> pd.DataFrame:
+    """
+    Load, downcast and stack the uploaded files.
+    Keyed on (name, content) pairs, so it runs once per distinct file set.
+    """
+    parts = [load_data(io.BytesIO(data), name) for name, data in files]
+    return concat_parts(parts, [name for name, _ in files])
+
+
+def _as_datetime(s: pd.Series) -> pd.Series:
+    """Parse a column to datetime, skipping the parse if it already is one."""
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+    return pd.to_datetime(s, errors="coerce")
+
+
 def generate_sample_data(n_rows: int = 1000) -> pd.DataFrame:
     """
     Generate synthetic sales data for demo purposes.
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     start_date = pd.Timestamp.now() - pd.Timedelta(days=120)
-    customers = list(range(1, 21))
-    products = list(range(101, 106))
-    regions = [1, 2, 3, 4]
-
-    records = []
-    for _ in range(n_rows):
-        date = start_date + pd.Timedelta(days=int(np.random.exponential(30)))
-        cust = np.random.choice(customers)
-        prod = np.random.choice(products)
-        region = np.random.choice(regions)
-        qty = np.random.randint(1, 50)
-        unit_price = np.random.choice([30, 50, 75, 100, 150, 200, 500, 1000])
-        discount = np.random.choice([0, 0, 0, 5, 10])
-        total = qty * unit_price * (1 - discount / 100)
-        records.append(
-            {
-                "TRANSACTION_DATE": date,
-                "CUSTOMER_ID": cust,
-                "PRODUCT_ID": prod,
-                "QUANTITY": qty,
-                "UNIT_PRICE": unit_price,
-                "TOTAL_AMOUNT": total,
-                "REGION_ID": region,
-                "DISCOUNT_PERCENTAGE": discount,
-            }
-        )
-    return pd.DataFrame(records)
+
+    # One vectorized draw per column
+    qty = rng.integers(1, 50, n_rows)
+    unit_price = rng.choice([30, 50, 75, 100, 150, 200, 500, 1000], n_rows)
+    discount = rng.choice([0, 0, 0, 5, 10], n_rows)
+    return pd.DataFrame(
+        {
+            "TRANSACTION_DATE": start_date + pd.to_timedelta(rng.exponential(30, n_rows).astype(int), unit="D"),
+            "CUSTOMER_ID": rng.integers(1, 21, n_rows),
+            "PRODUCT_ID": rng.integers(101, 106, n_rows),
+            "QUANTITY": qty,
+            "UNIT_PRICE": unit_price,
+            "TOTAL_AMOUNT": qty * unit_price * (1 - discount / 100),
+            "REGION_ID": rng.integers(1, 5, n_rows),
+            "DISCOUNT_PERCENTAGE": discount,
+        }
+    )
 
 
 # -----------------------------
 # KPI calculations
 # -----------------------------
+def _fast_sum_by(keys: pd.Series, values: pd.Series, sort: bool = False, dropna: bool = True) -> pd.DataFrame:
+    """
+    Sum values per key with factorize + bincount.
+    Cheaper than groupby for the small key spaces of regions and products.
+    """
+    codes, uniques = pd.factorize(keys, sort=sort, use_na_sentinel=dropna)
+    weights = values.to_numpy(dtype=np.float64, na_value=0.0)
+    if dropna:
+        present = codes >= 0
+        codes, weights = codes[present], weights[present]
+    revenue = np.bincount(codes, weights=weights, minlength=len(uniques))
+    return pd.DataFrame({keys.name: uniques, "REVENUE": revenue})
+
+
+@st.cache_resource(show_spinner=False, max_entries=_FRAME_CACHE_ENTRIES, ttl=_FRAME_CACHE_TTL)
+def _to_polars(df: pd.DataFrame):
+    """
+    Convert a DataFrame to Polars once per distinct input.
+    Cached as a shared resource: the frame is read-only, so reruns skip unpickling a copy.
+    """
+    return pl.from_pandas(df)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
 def compute_kpis(df: pd.DataFrame) -> Dict[str, float]:
-    df = df.copy()
-    total_revenue = df["TOTAL_AMOUNT"].sum()
+    if pl is not None:
+        row = (
+            _to_polars(df[["TOTAL_AMOUNT", "CUSTOMER_ID"]])
+            .lazy()
+            .select(
+                pl.col("TOTAL_AMOUNT").sum().alias("total_revenue"),
+                pl.len().alias("total_orders"),
+                pl.col("TOTAL_AMOUNT").mean().alias("avg_ticket"),
+                pl.col("CUSTOMER_ID").drop_nulls().n_unique().alias("unique_customers"),
+            )
+            .collect()
+            .row(0, named=True)
+        )
+        return row
+
+    # One NumPy reduction shared by the total and the average
+    amounts = df["TOTAL_AMOUNT"].to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = np.count_nonzero(~np.isnan(amounts))
+    total_revenue = np.nansum(amounts)
     total_orders = len(df)
-    avg_ticket = df["TOTAL_AMOUNT"].mean()
+    avg_ticket = total_revenue / valid if valid else np.nan
     unique_customers = df["CUSTOMER_ID"].nunique()
     return {
         "total_revenue": total_revenue,
@@ -99,66 +254,109 @@ def generic_kpis(df: pd.DataFrame, num_col: Optional[str], date_col: Optional[st
     total_rows = len(df)
     total_cols = len(df.columns)
     stats = {"rows": total_rows, "columns": total_cols}
-    if num_col and num_col in df.columns:
+    if num_col and num_col in df.columns and pd.api.types.is_numeric_dtype(df[num_col]):
+        values = df[num_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        total = values.sum()
         stats.update(
             {
-                "sum": df[num_col].sum(),
-                "mean": df[num_col].mean(),
-                "median": df[num_col].median(),
+                "sum": total,
+                "mean": total / values.size if values.size else np.nan,
+                "median": np.median(values) if values.size else np.nan,
             }
         )
-    if date_col and date_col in df.columns:
+    elif num_col and num_col in df.columns:
         stats.update(
             {
-                "min_date": pd.to_datetime(df[date_col]).min(),
-                "max_date": pd.to_datetime(df[date_col]).max(),
+                "sum": df[num_col].sum(),
+                "mean": df[num_col].mean(),
+                "median": df[num_col].median(),
             }
         )
+    if date_col and date_col in df.columns:
+        dates = _as_datetime(df[date_col])
+        stats.update({"min_date": dates.min(), "max_date": dates.max()})
     return stats
 
 
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
 def revenue_by_region(df: pd.DataFrame) -> pd.DataFrame:
-    return (
-        df.groupby("REGION_ID", dropna=False)["TOTAL_AMOUNT"]
-        .sum()
-        .reset_index()
-        .rename(columns={"TOTAL_AMOUNT": "REVENUE"})
-    )
+    if pl is not None:
+        return (
+            _to_polars(df[["REGION_ID", "TOTAL_AMOUNT"]])
+            .lazy()
+            .group_by("REGION_ID")
+            .agg(pl.col("TOTAL_AMOUNT").sum().alias("REVENUE"))
+            .sort("REGION_ID", nulls_last=True)
+            .collect()
+            .to_pandas()
+        )
+    return _fast_sum_by(df["REGION_ID"], df["TOTAL_AMOUNT"], sort=True, dropna=False)
 
 
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
 def monthly_trend(df: pd.DataFrame) -> pd.DataFrame:
+    if pl is not None:
+        m = (
+            _to_polars(df[["TRANSACTION_DATE", "TOTAL_AMOUNT"]])
+            .lazy()
+            .drop_nulls("TRANSACTION_DATE")
+            .group_by(pl.col("TRANSACTION_DATE").dt.truncate("1mo"))
+            .agg(pl.col("TOTAL_AMOUNT").sum().alias("REVENUE"))
+            .sort("TRANSACTION_DATE")
+            .collect()
+            .to_pandas()
+        )
+        # Fill months without sales with 0, as resample("MS") does
+        m = m.set_index("TRANSACTION_DATE").asfreq("MS", fill_value=0).reset_index()
+        m["PCT_CHANGE"] = m["REVENUE"].pct_change() * 100
+        return m
+
     m = (
-        df.set_index("TRANSACTION_DATE")
-        .resample("MS")["TOTAL_AMOUNT"]
+        df.groupby(pd.Grouper(key="TRANSACTION_DATE", freq="MS"))["TOTAL_AMOUNT"]
         .sum()
         .reset_index()
         .rename(columns={"TOTAL_AMOUNT": "REVENUE"})
     )
-    m["PCT_CHANGE"] = m["REVENUE"].pct_change() * 100
+    m["PCT_CHANGE"] = m["REVENUE"].pct_change().mul(100)
     return m
 
 
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
 def top_customers(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
-    return (
-        df.groupby("CUSTOMER_ID")["TOTAL_AMOUNT"]
-        .sum()
-        .reset_index()
-        .rename(columns={"TOTAL_AMOUNT": "REVENUE"})
-        .sort_values("REVENUE", ascending=False)
-        .head(n)
-    )
+    if pl is not None:
+        return (
+            _to_polars(df[["CUSTOMER_ID", "TOTAL_AMOUNT"]])
+            .lazy()
+            .drop_nulls("CUSTOMER_ID")
+            .group_by("CUSTOMER_ID")
+            .agg(pl.col("TOTAL_AMOUNT").sum().alias("REVENUE"))
+            .sort("REVENUE", descending=True)
+            .head(n)
+            .collect()
+            .to_pandas()
+        )
+    s = df.groupby("CUSTOMER_ID", sort=False, observed=True)["TOTAL_AMOUNT"].sum().nlargest(n)
+    return s.rename("REVENUE").reset_index()
 
 
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
 def product_performance(df: pd.DataFrame) -> pd.DataFrame:
-    return (
-        df.groupby("PRODUCT_ID")["TOTAL_AMOUNT"]
-        .sum()
-        .reset_index()
-        .rename(columns={"TOTAL_AMOUNT": "REVENUE"})
-        .sort_values("REVENUE", ascending=False)
-    )
+    if pl is not None:
+        return (
+            _to_polars(df[["PRODUCT_ID", "TOTAL_AMOUNT"]])
+            .lazy()
+            .drop_nulls("PRODUCT_ID")
+            .group_by("PRODUCT_ID")
+            .agg(pl.col("TOTAL_AMOUNT").sum().alias("REVENUE"))
+            .sort("REVENUE", descending=True)
+            .collect()
+            .to_pandas()
+        )
+    return _fast_sum_by(df["PRODUCT_ID"], df["TOTAL_AMOUNT"]).sort_values("REVENUE", ascending=False)
 
 
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
 def detect_outliers(
     df: pd.DataFrame,
     date_col: Optional[str],
@@ -174,32 +372,40 @@ def detect_outliers(
     if date_col not in df.columns or value_col not in df.columns:
         return pd.DataFrame()
     try:
-        tmp = df[[date_col, value_col]].copy()
-        tmp[date_col] = pd.to_datetime(tmp[date_col], errors="coerce")
+        tmp = df[[date_col, value_col]]
+        if not pd.api.types.is_datetime64_any_dtype(tmp[date_col]):
+            tmp = tmp.assign(**{date_col: pd.to_datetime(tmp[date_col], errors="coerce")})
         tmp = tmp.dropna(subset=[date_col, value_col])
-        revenue = tmp.groupby(date_col)[value_col].sum().reset_index()
+        revenue = tmp.groupby(date_col, sort=False)[value_col].sum().reset_index()
         if len(revenue) < 3:
             return pd.DataFrame()
-        z = (revenue[value_col] - revenue[value_col].mean()) / revenue[value_col].std(ddof=0)
+        values = revenue[value_col].to_numpy(dtype=np.float64)
+        if _zscore_mask is not None:
+            z, is_outlier = _zscore_mask(values, threshold)
+        else:
+            z = (values - values.mean()) / values.std()
+            is_outlier = np.abs(z) > threshold
         revenue["Z_SCORE"] = z
-        revenue["IS_OUTLIER"] = revenue["Z_SCORE"].abs() > threshold
+        revenue["IS_OUTLIER"] = is_outlier
         return revenue[revenue["IS_OUTLIER"]].sort_values(value_col, ascending=False)
     except Exception:
         return pd.DataFrame()
 
 
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
 def dataset_summary(df: pd.DataFrame) -> Dict[str, object]:
     return {
         "rows": len(df),
         "columns": len(df.columns),
         "columns_list": list(df.columns),
         "dtypes": df.dtypes.astype(str).to_dict(),
-        "missing_counts": df.isna().sum().to_dict(),
-        "numeric_cols": [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])],
+        "missing_counts": dict(zip(df.columns, df.isna().to_numpy().sum(axis=0).tolist())),
+        "numeric_cols": df.select_dtypes(include=["number", "bool"]).columns.tolist(),
         "date_like_cols": [c for c in df.columns if "date" in c.lower()],
     }
 
 
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
 def build_narrative_summary(
     df: pd.DataFrame,
     date_col: Optional[str],
@@ -208,14 +414,14 @@ def build_narrative_summary(
 ) -> str:
     rows = len(df)
     cols = len(df.columns)
-    numeric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+    numeric_cols = df.select_dtypes(include=["number", "bool"]).columns.tolist()
     sample_cats = cat_cols[:3] if cat_cols else []
 
     # Date span
     date_span = None
     if date_col and date_col in df.columns:
         try:
-            dates = pd.to_datetime(df[date_col], errors="coerce")
+            dates = _as_datetime(df[date_col])
             if not dates.dropna().empty:
                 date_span = (dates.min().date(), dates.max().date())
         except Exception:
@@ -232,9 +438,9 @@ def build_narrative_summary(
     # Sample categories and members
     cat_snippets = []
     for c in sample_cats:
-        uniq = df[c].dropna().unique().tolist()
-        if len(uniq) > 0:
-            cat_snippets.append(f"{c} (e.g., {', '.join(map(str, uniq[:5]))})")
+        uniq = df[c].dropna().drop_duplicates().head(5).tolist()
+        if uniq:
+            cat_snippets.append(f"{c} (e.g., {', '.join(map(str, uniq))})")
 
     parts = []
     parts.append(f"The dataset contains {rows:,} records with {cols} columns.")
@@ -259,23 +465,61 @@ def build_narrative_summary(
     return " ".join(parts) + " " + insight
 
 
+@st.cache_resource(show_spinner=False, max_entries=_FRAME_CACHE_ENTRIES, ttl=_FRAME_CACHE_TTL)
+def filter_df(
+    upload_key: Tuple[str, ...],
+    _df_raw: pd.DataFrame,
+    date_col: Optional[str],
+    start: Optional[pd.Timestamp] = None,
+    end: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """
+    Parse the date column and apply the optional date range.
+    Keyed on the upload identity rather than the frame's contents, and cached as a
+    shared resource so reruns reuse one read-only filtered frame without copying it.
+    """
+    if not date_col:
+        return _df_raw
+    df = _df_raw
+    if not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        df = df.assign(**{date_col: pd.to_datetime(df[date_col], errors="coerce")})
+    df = df.dropna(subset=[date_col])
+    if start is not None and end is not None:
+        df = df[(df[date_col] >= start) & (df[date_col] <= end)]
+    return df
+
+
+def _ensure_c(df: pd.DataFrame) -> pd.DataFrame:
+    """Give numeric columns that are strided views their own contiguous buffers."""
+    strided = [
+        c for c in df.select_dtypes(include="number").columns
+        if not df[c].to_numpy().flags.c_contiguous
+    ]
+    if strided:
+        df = df.assign(**{c: np.ascontiguousarray(df[c].to_numpy()) for c in strided})
+    return df
+
+
 # -----------------------------
 # Mapping helpers
 # -----------------------------
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH_FUNCS)
 def suggest_columns(df: pd.DataFrame) -> Tuple[Optional[str], Optional[str], List[str]]:
-    num_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
-    date_cols = [c for c in df.columns if pd.api.types.is_datetime64_any_dtype(df[c])]
-    # Try to parse obvious date-like columns
+    num_cols = df.select_dtypes(include=["number", "bool"]).columns.tolist()
+    date_cols = df.select_dtypes(include=["datetime", "datetimetz"]).columns.tolist()
+    # Probe the first date-like column; the frame itself is left untouched
     if not date_cols:
         for c in df.columns:
             if "date" in c.lower():
                 try:
-                    df[c] = pd.to_datetime(df[c])
+                    pd.to_datetime(df[c].head(100))
                     date_cols.append(c)
                 except Exception:
                     pass
                 break
-    cat_cols = [c for c in df.columns if pd.api.types.is_object_dtype(df[c]) or pd.api.types.is_categorical_dtype(df[c])]
+    cat_cols = [
+        c for c in df.select_dtypes(include=["object", "category"]).columns if c not in date_cols
+    ]
     date_col = date_cols[0] if date_cols else None
     num_col = num_cols[0] if num_cols else None
     return date_col, num_col, cat_cols[:3]
@@ -284,6 +528,26 @@ def suggest_columns(df: pd.DataFrame) -> Tuple[Optional[str], Optional[str], Lis
 # -----------------------------
 # Visualization helpers
 # -----------------------------
+def _downsample_for_line(
+    df: pd.DataFrame, date_col: str, num_col: str, max_points: int = 1000
+) -> pd.DataFrame:
+    """
+    Cap a raw-row line chart at about max_points by summing into equal time buckets.
+    Small frames and non-numeric columns are plotted row by row as before.
+    """
+    if len(df) <= max_points or not pd.api.types.is_numeric_dtype(df[num_col]):
+        return df.sort_values(date_col)
+    span = df[date_col].max() - df[date_col].min()
+    bucket = max(int(np.ceil(span.total_seconds() / max_points)), 1)
+    # Empty buckets stay NaN and are dropped, so gaps are not drawn as zero
+    return (
+        df.groupby(pd.Grouper(key=date_col, freq=f"{bucket}s"))[num_col]
+        .sum(min_count=1)
+        .dropna()
+        .reset_index()
+    )
+
+
 def card(label: str, value: str, sub: str = ""):
     st.markdown(
         f"""
@@ -333,16 +597,13 @@ try:
         st.stop()
 
     if uploaded_files:
-        parts = []
-        for f in uploaded_files:
-            df_part = load_data(f, getattr(f, "name", None))
-            df_part["SOURCE_FILE"] = getattr(f, "name", "uploaded.csv")
-            parts.append(df_part)
-        df_raw = pd.concat(parts, ignore_index=True)
+        df_raw = prepare(tuple((getattr(f, "name", "uploaded.csv"), f.getvalue()) for f in uploaded_files))
+        # Streamlit assigns each uploaded file a new id, so this identifies the data set
+        upload_key = tuple(f.file_id for f in uploaded_files)
 
     # Dynamic mapping UI
     st.sidebar.subheader("Column mapping")
-    date_suggest, num_suggest, cat_suggest = suggest_columns(df_raw.copy())
+    date_suggest, num_suggest, cat_suggest = suggest_columns(df_raw)
     date_col = st.sidebar.selectbox(
         "Date column (optional)",
         options=[None] + list(df_raw.columns),
@@ -359,10 +620,7 @@ try:
         default=[c for c in cat_suggest if c in df_raw.columns],
     )
 
-    df = df_raw.copy()
-    if date_col:
-        df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
-        df = df.dropna(subset=[date_col])
+    df = filter_df(upload_key, df_raw, date_col)
 
     # Date filter if date column exists
     if date_col:
@@ -375,7 +633,7 @@ try:
         )
         if date_range and len(date_range) == 2:
             start, end = pd.to_datetime(date_range[0]), pd.to_datetime(date_range[1])
-            df = df[(df[date_col] >= start) & (df[date_col] <= end)]
+            df = filter_df(upload_key, df, date_col, start, end)
 except Exception as e:
     st.error(f"Failed to load data: {e}")
     st.stop()
@@ -388,6 +646,12 @@ if df.empty:
     st.warning("The dataset is empty. Please upload a valid CSV/XLSX file.")
     st.stop()
 
+# Unit-stride numeric columns for the reductions below
+df = _ensure_c(df)
+
+# One preview slice shared by the sample table and the preview expander
+preview = df.head(200)
+
 # Determine if sales schema is present for legacy charts
 sales_required = {"TRANSACTION_DATE", "CUSTOMER_ID", "PRODUCT_ID", "QUANTITY", "UNIT_PRICE", "TOTAL_AMOUNT"}
 has_sales_schema = sales_required.issubset(set(df.columns))
@@ -495,7 +759,7 @@ else:
     st.subheader("Generic visuals")
     if date_col and num_col and num_col in df.columns and date_col in df.columns:
         fig = px.line(
-            df.sort_values(date_col),
+            _downsample_for_line(df, date_col, num_col),
             x=date_col,
             y=num_col,
             markers=True,
@@ -509,7 +773,7 @@ else:
     if cat_cols and num_col and num_col in df.columns:
         cat = cat_cols[0]
         agg = (
-            df.groupby(cat)[num_col]
+            df.groupby(cat, sort=False, observed=True)[num_col]
             .sum()
             .reset_index()
             .sort_values(num_col, ascending=False)
@@ -519,7 +783,7 @@ else:
         st.plotly_chart(fig, width="stretch")
 
     st.subheader("Data sample")
-    st.dataframe(df.head(200), width="stretch")
+    st.dataframe(preview, width="stretch")
 
 # Dataset summary (always shown)
 st.divider()
@@ -536,7 +800,7 @@ with colC:
     st.write("Missing counts (top 10):")
     miss = summary["missing_counts"]
     if miss:
-        miss_top = dict(sorted(miss.items(), key=lambda x: x[1], reverse=True)[:10])
+        miss_top = dict(heapq.nlargest(10, miss.items(), key=lambda x: x[1]))
         st.json(miss_top)
     else:
         st.write("No missing values reported.")
@@ -557,7 +821,7 @@ else:
 st.divider()
 
 with st.expander("Data preview", expanded=False):
-    st.dataframe(df.head(200), width="stretch")
+    st.dataframe(preview, width="stretch")
 
 st.success("Streamlit Analytics Studio is ready. Upload your CSV or use the bundled sample data.")
 
@@ -5,26 +5,51 @@ Loads configuration from YAML file
 
 import yaml
 import os
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _Loader  # LibYAML-backed parser
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 def load_config(config_path='config.yaml'):
     """
     Load configuration from YAML file
     
+    Parsed files are cached per (absolute path, mtime), so repeated calls
+    skip the YAML parse while edits to the file still take effect.
+    
     Args:
         config_path: Path to config file
         
     Returns:
-        dict: Configuration dictionary
+        dict: Configuration dictionary (shared; do not mutate)
     """
     config_file = Path(config_path)
     
     if not config_file.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
     
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
+    config_file = config_file.resolve()
+    return _load_config_cached(str(config_file), os.path.getmtime(config_file))
+
+
+@lru_cache(maxsize=None)
+def _load_config_cached(config_path, mtime):
+    """
+    Parse a YAML config file (cached by path and mtime)
+    
+    Args:
+        config_path: Absolute path to config file
+        mtime: File modification time, part of the cache key
+        
+    Returns:
+        dict: Configuration dictionary
+    """
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=_Loader)
     
     return config
 
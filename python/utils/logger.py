@@ -7,6 +7,12 @@ import os
 from pathlib import Path
 from datetime import datetime
 
+# Shared by every handler setup_logger creates
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
 
 def setup_logger(name, log_file=None, level=logging.INFO):
     """
@@ -27,28 +33,25 @@ def setup_logger(name, log_file=None, level=logging.INFO):
     if logger.handlers:
         return logger
     
+    # Records are emitted by this logger's handlers only, not again by root's
+    logger.propagate = False
+    
     # Create logs directory if it doesn't exist
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
     # File handler
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
     
     return logger
@@ -4,10 +4,12 @@ Creates visualizations using matplotlib, seaborn, and plotly
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Files only; skip GUI backend detection
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from functools import lru_cache
 from pathlib import Path
 from python.data_loader.oracle_connector import OracleConnector
 from python.utils.logger import setup_logger
@@ -20,6 +22,14 @@ sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 
 
+@lru_cache(maxsize=None)
+def get_plotly():
+    """Import the Plotly figure API on first use; only the interactive dashboard needs it"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    return go, make_subplots
+
+
 class ChartGenerator:
     """Chart generation manager"""
     
@@ -33,6 +43,22 @@ class ChartGenerator:
         self.config = load_config(config_path)
         self.charts_path = Path(self.config['paths']['reports_charts'])
         self.charts_path.mkdir(parents=True, exist_ok=True)
+        # One figure reused by every matplotlib chart, cleared between charts
+        self._fig = Figure()
+    
+    def _new_axes(self, figsize):
+        """
+        Clear the shared figure and return a fresh axes
+        
+        Args:
+            figsize: (width, height) in inches for the next chart
+            
+        Returns:
+            matplotlib.axes.Axes: Axes to draw on
+        """
+        self._fig.clear()
+        self._fig.set_size_inches(*figsize)
+        return self._fig.add_subplot()
     
     def plot_revenue_by_region(self, start_date=None, end_date=None):
         """
@@ -53,26 +79,23 @@ class ChartGenerator:
                 GROUP BY r.REGION_NAME
                 ORDER BY TOTAL_REVENUE DESC
             """
-            results = db.execute_query(query, {'start_date': start_date, 'end_date': end_date})
+            df = db.execute_df(query, {'start_date': start_date, 'end_date': end_date})
             
-            if not results:
+            if df.empty:
                 logger.warning("No data found for revenue by region")
                 return
             
-            df = pd.DataFrame(results, columns=['REGION_NAME', 'TOTAL_REVENUE'])
-            
             # Matplotlib chart
-            plt.figure(figsize=(10, 6))
-            plt.bar(df['REGION_NAME'], df['TOTAL_REVENUE'], color='steelblue')
-            plt.title('Revenue by Region', fontsize=16, fontweight='bold')
-            plt.xlabel('Region', fontsize=12)
-            plt.ylabel('Total Revenue', fontsize=12)
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+            ax = self._new_axes((10, 6))
+            ax.bar(df['REGION_NAME'], df['TOTAL_REVENUE'], color='steelblue')
+            ax.set_title('Revenue by Region', fontsize=16, fontweight='bold')
+            ax.set_xlabel('Region', fontsize=12)
+            ax.set_ylabel('Total Revenue', fontsize=12)
+            ax.tick_params(axis='x', labelrotation=45)
+            self._fig.tight_layout()
             
             chart_file = self.charts_path / 'revenue_by_region.png'
-            plt.savefig(chart_file, dpi=300, bbox_inches='tight')
-            plt.close()
+            self._fig.savefig(chart_file, dpi=150, bbox_inches='tight')
             
             logger.info(f"Saved chart: {chart_file}")
     
@@ -87,28 +110,26 @@ class ChartGenerator:
                 WHERE KPI_NAME = 'MONTHLY_REVENUE_TREND'
                 ORDER BY KPI_DATE
             """
-            results = db.execute_query(query)
+            df = db.execute_df(query)
             
-            if not results:
+            if df.empty:
                 logger.warning("No data found for monthly trend")
                 return
             
-            df = pd.DataFrame(results, columns=['KPI_DATE', 'KPI_VALUE'])
             df['KPI_DATE'] = pd.to_datetime(df['KPI_DATE'])
             
             # Seaborn line chart
-            plt.figure(figsize=(12, 6))
-            sns.lineplot(data=df, x='KPI_DATE', y='KPI_VALUE', marker='o', linewidth=2)
-            plt.title('Monthly Revenue Trend', fontsize=16, fontweight='bold')
-            plt.xlabel('Month', fontsize=12)
-            plt.ylabel('Revenue', fontsize=12)
-            plt.xticks(rotation=45)
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
+            ax = self._new_axes((12, 6))
+            sns.lineplot(data=df, x='KPI_DATE', y='KPI_VALUE', marker='o', linewidth=2, ax=ax)
+            ax.set_title('Monthly Revenue Trend', fontsize=16, fontweight='bold')
+            ax.set_xlabel('Month', fontsize=12)
+            ax.set_ylabel('Revenue', fontsize=12)
+            ax.tick_params(axis='x', labelrotation=45)
+            ax.grid(True, alpha=0.3)
+            self._fig.tight_layout()
             
             chart_file = self.charts_path / 'monthly_revenue_trend.png'
-            plt.savefig(chart_file, dpi=300, bbox_inches='tight')
-            plt.close()
+            self._fig.savefig(chart_file, dpi=150, bbox_inches='tight')
             
             logger.info(f"Saved chart: {chart_file}")
     
@@ -128,25 +149,22 @@ class ChartGenerator:
                 ORDER BY REVENUE DESC
                 FETCH FIRST :top_n ROWS ONLY
             """
-            results = db.execute_query(query, {'top_n': top_n})
+            df = db.execute_df(query, {'top_n': top_n})
             
-            if not results:
+            if df.empty:
                 logger.warning("No data found for top customers")
                 return
             
-            df = pd.DataFrame(results, columns=['CUSTOMER_NAME', 'REVENUE'])
-            
             # Horizontal bar chart
-            plt.figure(figsize=(10, 8))
-            plt.barh(df['CUSTOMER_NAME'], df['REVENUE'], color='coral')
-            plt.title(f'Top {top_n} Customers by Revenue', fontsize=16, fontweight='bold')
-            plt.xlabel('Revenue', fontsize=12)
-            plt.ylabel('Customer', fontsize=12)
-            plt.tight_layout()
+            ax = self._new_axes((10, 8))
+            ax.barh(df['CUSTOMER_NAME'], df['REVENUE'], color='coral')
+            ax.set_title(f'Top {top_n} Customers by Revenue', fontsize=16, fontweight='bold')
+            ax.set_xlabel('Revenue', fontsize=12)
+            ax.set_ylabel('Customer', fontsize=12)
+            self._fig.tight_layout()
             
             chart_file = self.charts_path / 'top_customers.png'
-            plt.savefig(chart_file, dpi=300, bbox_inches='tight')
-            plt.close()
+            self._fig.savefig(chart_file, dpi=150, bbox_inches='tight')
             
             logger.info(f"Saved chart: {chart_file}")
     
@@ -154,6 +172,8 @@ class ChartGenerator:
         """
         Create interactive Plotly dashboard
         """
+        go, make_subplots = get_plotly()
+        
         with OracleConnector() as db:
             # Get revenue by region
             query1 = """
@@ -219,5 +239,6 @@ class ChartGenerator:
         self.plot_monthly_trend()
         self.plot_top_customers()
         self.create_interactive_dashboard()
+        plt.close('all')
         logger.info("All charts generated successfully")
 
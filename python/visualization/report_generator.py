@@ -3,16 +3,56 @@ Report Generator
 Creates text and CSV summary reports
 """
 
-import pandas as pd
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from python.data_loader.oracle_connector import OracleConnector
+from python.data_loader.oracle_connector import OracleConnector, clear_query_cache
 from python.utils.logger import setup_logger
 from python.utils.config_loader import load_config
 from python.analytics.insight_generator import InsightGenerator
 
 logger = setup_logger(__name__)
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; the KPI summary is then CSV only
+    pa = None
+
+KPI_SUMMARY_COLUMNS = ['KPI_NAME', 'KPI_DATE', 'KPI_VALUE', 'REGION_ID', 'CALCULATION_DATE']
+
+if pa is not None:
+    KPI_SUMMARY_SCHEMA = pa.schema([
+        ('KPI_NAME', pa.string()),
+        ('KPI_DATE', pa.timestamp('us')),
+        ('KPI_VALUE', pa.float64()),
+        # Undeclared-scale NUMBER may arrive as float, and is NULL for global KPIs;
+        # float64 accepts both and matches how the CSV copy reads back
+        ('REGION_ID', pa.float64()),
+        ('CALCULATION_DATE', pa.timestamp('us'))
+    ])
+
+# Report KPIs in one round trip; rows are tagged by the section they feed
+REPORT_KPIS_QUERY = """
+    SELECT 'TOTAL' AS TAG, NULL AS REGION_NAME, SUM(KPI_VALUE) AS AMOUNT
+    FROM KPI_RESULTS
+    WHERE KPI_NAME = 'MONTHLY_REVENUE_TREND'
+    UNION ALL
+    SELECT 'AVG', NULL, AVG(KPI_VALUE)
+    FROM KPI_RESULTS
+    WHERE KPI_NAME = 'AVG_TRANSACTION_VALUE'
+    UNION ALL
+    SELECT 'REGION', r.REGION_NAME, SUM(k.KPI_VALUE)
+    FROM KPI_RESULTS k
+    JOIN REGIONS r ON k.REGION_ID = r.REGION_ID
+    WHERE k.KPI_NAME = 'REVENUE_BY_REGION'
+    GROUP BY r.REGION_NAME
+    ORDER BY 3 DESC
+"""
+
 
 class ReportGenerator:
     """Report generation manager"""
@@ -30,6 +70,8 @@ class ReportGenerator:
         self.summaries_path.mkdir(parents=True, exist_ok=True)
         self.insights_path.mkdir(parents=True, exist_ok=True)
         self.insight_gen = InsightGenerator(config_path)
+        # (MAX(CALCULATION_DATE) of KPI_RESULTS, insights text) from the last run
+        self._insights_cache = (None, None)
     
     def generate_kpi_summary_csv(self):
         """
@@ -46,24 +88,77 @@ class ReportGenerator:
                 FROM KPI_RESULTS
                 ORDER BY KPI_NAME, KPI_DATE DESC
             """
-            results = db.execute_query(query)
+            batches = db.iter_query(query, batch_size=5000)
+            first = next(batches, None)
             
-            if not results:
+            if not first:
                 logger.warning("No KPI data found")
                 return
             
-            df = pd.DataFrame(results, columns=[
-                'KPI_NAME', 'KPI_DATE', 'KPI_VALUE', 'REGION_ID', 'CALCULATION_DATE'
-            ])
-            
-            csv_file = self.summaries_path / f'kpi_summary_{datetime.now().strftime("%Y%m%d")}.csv'
-            df.to_csv(csv_file, index=False)
+            # Stream batches straight to disk; memory stays at one batch.
+            # A Parquet copy is written alongside for fast dashboard reloads.
+            summary_name = f'kpi_summary_{datetime.now().strftime("%Y%m%d")}'
+            csv_file = self.summaries_path / f'{summary_name}.csv'
+            parquet_file = self.summaries_path / f'{summary_name}.parquet'
+            parquet_writer = (
+                pq.ParquetWriter(parquet_file, KPI_SUMMARY_SCHEMA, compression='zstd')
+                if pa is not None else nullcontext()
+            )
+            with open(csv_file, 'w', newline='') as f, parquet_writer:
+                writer = csv.writer(f)
+                writer.writerow(KPI_SUMMARY_COLUMNS)
+                for batch in chain([first], batches):
+                    writer.writerows(batch)
+                    if pa is not None:
+                        parquet_writer.write_table(self._kpi_batch_table(batch))
             
             logger.info(f"Generated KPI summary CSV: {csv_file}")
     
-    def generate_text_report(self):
+    @staticmethod
+    def _kpi_batch_table(batch):
+        """
+        Build an Arrow table from a batch of KPI summary rows
+        
+        Args:
+            batch: List of (KPI_NAME, KPI_DATE, KPI_VALUE, REGION_ID, CALCULATION_DATE) rows
+            
+        Returns:
+            pyarrow.Table: Batch in KPI_SUMMARY_SCHEMA
+        """
+        columns = zip(*batch)
+        return pa.Table.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, KPI_SUMMARY_SCHEMA)],
+            schema=KPI_SUMMARY_SCHEMA
+        )
+    
+    def summary_insights(self):
+        """
+        Get summary insights, regenerating only when KPI results have been recalculated
+        
+        Returns:
+            str: Summary insights text
+        """
+        with OracleConnector() as db:
+            results = db.execute_query("SELECT MAX(CALCULATION_DATE) FROM KPI_RESULTS")
+        tag = results[0][0] if results else None
+        
+        cached_tag, cached_text = self._insights_cache
+        if tag is not None and tag == cached_tag:
+            return cached_text
+        
+        # KPIs changed (possibly in another process); drop query results
+        # InsightGenerator cached from before the recalculation
+        clear_query_cache()
+        text = self.insight_gen.generate_summary_insights()
+        self._insights_cache = (tag, text)
+        return text
+    
+    def generate_text_report(self, insights=None):
         """
         Generate comprehensive text report
+        
+        Args:
+            insights: Precomputed summary insights (generated if None)
         """
         report_lines = []
         report_lines.append("=" * 80)
@@ -73,83 +168,93 @@ class ReportGenerator:
         report_lines.append("")
         
         with OracleConnector() as db:
-            # Total Revenue
-            query1 = """
-                SELECT SUM(KPI_VALUE) as TOTAL_REVENUE
-                FROM KPI_RESULTS
-                WHERE KPI_NAME = 'MONTHLY_REVENUE_TREND'
-            """
-            result1 = db.execute_query(query1)
-            if result1 and result1[0][0]:
-                report_lines.append(f"Total Revenue: ${result1[0][0]:,.2f}")
-            
-            # Revenue by Region
-            query2 = """
-                SELECT r.REGION_NAME, SUM(k.KPI_VALUE) as REVENUE
-                FROM KPI_RESULTS k
-                JOIN REGIONS r ON k.REGION_ID = r.REGION_ID
-                WHERE k.KPI_NAME = 'REVENUE_BY_REGION'
-                GROUP BY r.REGION_NAME
-                ORDER BY REVENUE DESC
-            """
-            result2 = db.execute_query(query2)
-            if result2:
-                report_lines.append("")
-                report_lines.append("Revenue by Region:")
-                report_lines.append("-" * 40)
-                for row in result2:
-                    report_lines.append(f"  {row[0]}: ${row[1]:,.2f}")
-            
-            # Average Transaction Value
-            query3 = """
-                SELECT AVG(KPI_VALUE) as AVG_VALUE
-                FROM KPI_RESULTS
-                WHERE KPI_NAME = 'AVG_TRANSACTION_VALUE'
-            """
-            result3 = db.execute_query(query3)
-            if result3 and result3[0][0]:
-                report_lines.append("")
-                report_lines.append(f"Average Transaction Value: ${result3[0][0]:,.2f}")
+            results = db.execute_query(REPORT_KPIS_QUERY)
+        
+        total_revenue = avg_value = None
+        region_rows = []  # already ordered by revenue, descending
+        for tag, region_name, amount in results or []:
+            if tag == 'TOTAL':
+                total_revenue = amount
+            elif tag == 'AVG':
+                avg_value = amount
+            else:
+                region_rows.append((region_name, amount))
+        
+        # Total Revenue
+        if total_revenue:
+            report_lines.append(f"Total Revenue: ${total_revenue:,.2f}")
+        
+        # Revenue by Region
+        if region_rows:
+            report_lines.append("")
+            report_lines.append("Revenue by Region:")
+            report_lines.append("-" * 40)
+            for region_name, revenue in region_rows:
+                report_lines.append(f"  {region_name}: ${revenue:,.2f}")
+        
+        # Average Transaction Value
+        if avg_value:
+            report_lines.append("")
+            report_lines.append(f"Average Transaction Value: ${avg_value:,.2f}")
         
         # Add insights
         report_lines.append("")
         report_lines.append("=" * 80)
         report_lines.append("INSIGHTS")
         report_lines.append("=" * 80)
-        insights = self.insight_gen.generate_summary_insights()
+        if insights is None:
+            insights = self.summary_insights()
         report_lines.append(insights)
         
         report_text = "\n".join(report_lines)
         
         report_file = self.summaries_path / f'report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
-        with open(report_file, 'w') as f:
+        with open(report_file, 'w', buffering=1 << 20, encoding='utf-8', newline='\n') as f:
             f.write(report_text)
         
         logger.info(f"Generated text report: {report_file}")
         return report_text
     
-    def generate_insight_file(self):
+    def generate_insight_file(self, insights=None):
         """
         Generate standalone insight file
+        
+        Args:
+            insights: Precomputed summary insights (generated if None)
         """
-        insights = self.insight_gen.generate_summary_insights()
+        if insights is None:
+            insights = self.summary_insights()
         
         insight_file = self.insights_path / f'insights_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
-        with open(insight_file, 'w') as f:
-            f.write("=" * 80 + "\n")
-            f.write("AUTOMATED INSIGHTS REPORT\n")
-            f.write("=" * 80 + "\n")
-            f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("\n")
-            f.write(insights)
+        insight_text = "".join([
+            "=" * 80 + "\n",
+            "AUTOMATED INSIGHTS REPORT\n",
+            "=" * 80 + "\n",
+            f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            "\n",
+            insights
+        ])
+        with open(insight_file, 'w', buffering=1 << 20, encoding='utf-8', newline='\n') as f:
+            f.write(insight_text)
         
         logger.info(f"Generated insight file: {insight_file}")
     
     def generate_all_reports(self):
         """Generate all reports"""
         logger.info("Generating all reports...")
-        self.generate_kpi_summary_csv()
-        self.generate_text_report()
-        self.generate_insight_file()
+        
+        # Insights feed both the text report and the insight file; compute once.
+        # This also creates the shared session pool before the stages start.
+        insights = self.summary_insights() if self.insight_gen else None
+        
+        # Stages are independent and I/O-bound, so they run concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.generate_kpi_summary_csv),
+                executor.submit(self.generate_text_report, insights=insights),
+                executor.submit(self.generate_insight_file, insights=insights)
+            ]
+            for future in futures:
+                future.result()
         logger.info("All reports generated successfully")
 
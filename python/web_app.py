@@ -2,13 +2,22 @@
 Flask Web Application - Frontend for Enterprise Sales Analytics
 """
 
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+from flask import (Flask, Response, render_template, request, jsonify,
+                   send_from_directory, make_response, redirect, url_for)
+from werkzeug.http import is_resource_modified
 import sys
 from pathlib import Path
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import csv
+import io
+from itertools import islice
 import json
 import os
+import shutil
+import subprocess
+import threading
+import uuid
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -16,61 +25,186 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from python.utils.logger import setup_logger
 from python.utils.config_loader import load_config
 
+try:
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError:
+    WsgiToAsgi = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'enterprise-sales-analytics-2024'
 app.config['UPLOAD_FOLDER'] = 'data/input'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['COMPRESS_MIMETYPES'] = ['text/html', 'text/plain', 'text/csv', 'application/json']
+app.config['COMPRESS_LEVEL'] = 5
+app.config['COMPRESS_MIN_SIZE'] = 1024
+if Compress is not None:
+    Compress(app)
 
 logger = setup_logger(__name__, 'logs/web_app.log')
 
+# Report directories are fixed for the life of the process
+CONFIG = load_config()
+CHARTS_DIR = Path(CONFIG['paths']['reports_charts'])
+SUMMARIES_DIR = Path(CONFIG['paths']['reports_summaries'])
+INSIGHTS_DIR = Path(CONFIG['paths']['reports_insights'])
 
-def get_reports_data():
-    """Get available reports and charts"""
-    config = load_config()
-    charts_path = Path(config['paths']['reports_charts'])
-    summaries_path = Path(config['paths']['reports_summaries'])
-    insights_path = Path(config['paths']['reports_insights'])
+CHART_SUFFIXES = ('.png', '.html')
+REPORT_SUFFIXES = ('.txt', '.csv')
+INSIGHT_SUFFIXES = ('.txt',)
+
+
+def _list_files(directory, suffixes):
+    """
+    List files in a directory with the given suffixes in a single scan
     
-    charts = []
-    if charts_path.exists():
-        charts = [f.name for f in charts_path.glob('*.png')] + [f.name for f in charts_path.glob('*.html')]
+    Args:
+        directory: Directory to scan
+        suffixes: Tuple of filename suffixes to keep
+        
+    Returns:
+        list: (name, os.stat_result) pairs; empty if the directory is missing
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [(e.name, e.stat()) for e in entries if e.name.endswith(suffixes) and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _count_chart_types(charts):
+    """
+    Count static and interactive charts in one pass
     
-    reports = []
-    if summaries_path.exists():
-        reports = [f.name for f in summaries_path.glob('*.txt')] + [f.name for f in summaries_path.glob('*.csv')]
+    Args:
+        charts: Chart filenames
+        
+    Returns:
+        tuple: (PNG chart count, HTML dashboard count)
+    """
+    png = html = 0
+    for chart in charts:
+        if chart.endswith('.png'):
+            png += 1
+        elif chart.endswith('.html'):
+            html += 1
+    return png, html
+
+
+def get_reports_data():
+    """Get available reports and charts"""
+    charts = [name for name, _ in _list_files(CHARTS_DIR, CHART_SUFFIXES)]
+    reports = [name for name, _ in _list_files(SUMMARIES_DIR, REPORT_SUFFIXES)]
+    insights = [name for name, _ in _list_files(INSIGHTS_DIR, INSIGHT_SUFFIXES)]
+    return charts, reports, insights
+
+
+# Latest-file lookups: (directory, prefix, suffix) -> (directory mtime, newest file),
+# and (file, file mtime) -> loaded content
+_latest_file_cache = {}
+_report_cache = {}
+
+
+def _latest_file(directory, prefix, suffix):
+    """
+    Find the newest file named prefix*suffix, rescanning only when the directory changes
     
-    insights = []
-    if insights_path.exists():
-        insights = [f.name for f in insights_path.glob('*.txt')]
+    Args:
+        directory: Directory to search
+        prefix: Filename prefix
+        suffix: Filename suffix
+        
+    Returns:
+        Path or None: Newest matching file
+    """
+    dir_mtime = directory.stat().st_mtime
+    key = (directory, prefix, suffix)
+    cached = _latest_file_cache.get(key)
+    if cached is None or cached[0] != dir_mtime:
+        # Names embed a YYYYMMDD[_HHMMSS] stamp, so the greatest name is the newest file
+        latest_name = None
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith(suffix) and (
+                    latest_name is None or name > latest_name
+                ):
+                    latest_name = name
+        latest = directory / latest_name if latest_name is not None else None
+        cached = _latest_file_cache[key] = (dir_mtime, latest)
+    return cached[1]
+
+
+def _load_cached(path, loader):
+    """
+    Load a file through loader, reusing the result while the file is unchanged
     
-    return charts, reports, insights
+    Args:
+        path: File to load
+        loader: Callable taking the path and returning its parsed content
+        
+    Returns:
+        Parsed content
+    """
+    key = (path, path.stat().st_mtime)
+    if key not in _report_cache:
+        # Drop stale entries for this file before caching the new version
+        for stale in [k for k in _report_cache if k[0] == path]:
+            del _report_cache[stale]
+        _report_cache[key] = loader(path)
+    return _report_cache[key]
+
+
+def _read_text(path):
+    """Read a text file"""
+    with open(path, 'r') as f:
+        return f.read()
 
 
 def get_latest_report():
     """Get the latest text report content"""
-    config = load_config()
-    summaries_path = Path(config['paths']['reports_summaries'])
-    
-    if summaries_path.exists():
-        txt_files = list(summaries_path.glob('report_*.txt'))
-        if txt_files:
-            latest = max(txt_files, key=lambda p: p.stat().st_mtime)
-            with open(latest, 'r') as f:
-                return f.read()
+    if SUMMARIES_DIR.exists():
+        latest = _latest_file(SUMMARIES_DIR, 'report_', '.txt')
+        if latest is not None:
+            return _load_cached(latest, _read_text)
     return "No reports available. Please run the analytics pipeline first."
 
 
+KPI_SUMMARY_COLUMNS = ['KPI_NAME', 'KPI_DATE', 'KPI_VALUE', 'REGION_ID', 'CALCULATION_DATE']
+
+
+def _read_kpi_parquet(path):
+    """Read KPI summary records from Parquet, with dates formatted as in the CSV"""
+    df = pd.read_parquet(path, columns=KPI_SUMMARY_COLUMNS)
+    for col in ('KPI_DATE', 'CALCULATION_DATE'):
+        df[col] = df[col].dt.strftime('%Y-%m-%d %H:%M:%S')
+    return df.to_dict('records')
+
+
 def get_kpi_summary():
     """Get KPI summary data"""
-    config = load_config()
-    summaries_path = Path(config['paths']['reports_summaries'])
-    
-    if summaries_path.exists():
-        csv_files = list(summaries_path.glob('kpi_summary_*.csv'))
-        if csv_files:
-            latest = max(csv_files, key=lambda p: p.stat().st_mtime)
-            df = pd.read_csv(latest)
-            return df.to_dict('records')
+    if SUMMARIES_DIR.exists():
+        latest_csv = _latest_file(SUMMARIES_DIR, 'kpi_summary_', '.csv')
+        latest_parquet = _latest_file(SUMMARIES_DIR, 'kpi_summary_', '.parquet')
+        # Prefer the Parquet copy unless a newer CSV-only summary exists
+        if latest_parquet is not None and (
+            latest_csv is None or latest_parquet.stat().st_mtime >= latest_csv.stat().st_mtime
+        ):
+            try:
+                return _load_cached(latest_parquet, _read_kpi_parquet)
+            except ImportError:  # no Parquet engine installed
+                pass
+        if latest_csv is not None:
+            return _load_cached(latest_csv, lambda p: pd.read_csv(p).to_dict('records'))
     return []
 
 
@@ -82,9 +216,10 @@ def index():
     kpi_data = get_kpi_summary()
     
     # Calculate summary statistics
+    png_count, html_count = _count_chart_types(charts)
     summary_stats = {
-        'total_charts': len([c for c in charts if c.endswith('.png')]),
-        'interactive_dashboards': len([c for c in charts if c.endswith('.html')]),
+        'total_charts': png_count,
+        'interactive_dashboards': html_count,
         'reports': len(reports),
         'insights': len(insights)
     }
@@ -105,9 +240,7 @@ def dashboard():
     dashboard_file = None
     
     # Find interactive dashboard
-    config = load_config()
-    charts_path = Path(config['paths']['reports_charts'])
-    dashboard_path = charts_path / 'interactive_dashboard.html'
+    dashboard_path = CHARTS_DIR / 'interactive_dashboard.html'
     
     if dashboard_path.exists():
         dashboard_file = 'interactive_dashboard.html'
@@ -118,21 +251,14 @@ def dashboard():
 @app.route('/charts')
 def charts():
     """Charts gallery page"""
-    charts, _, _ = get_reports_data()
-    config = load_config()
-    charts_path = Path(config['paths']['reports_charts'])
-    
     chart_list = []
-    for chart in charts:
-        chart_path = charts_path / chart
-        if chart_path.exists():
-            stat = chart_path.stat()
-            chart_list.append({
-                'name': chart,
-                'size': f"{stat.st_size / 1024:.1f} KB",
-                'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                'type': 'Interactive Dashboard' if chart.endswith('.html') else 'Chart'
-            })
+    for chart, stat in _list_files(CHARTS_DIR, CHART_SUFFIXES):
+        chart_list.append({
+            'name': chart,
+            'size': f"{stat.st_size / 1024:.1f} KB",
+            'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+            'type': 'Interactive Dashboard' if chart.endswith('.html') else 'Chart'
+        })
     
     return render_template('charts.html', charts=chart_list)
 
@@ -140,37 +266,50 @@ def charts():
 @app.route('/reports')
 def reports():
     """Reports page"""
-    _, reports, insights = get_reports_data()
-    config = load_config()
-    summaries_path = Path(config['paths']['reports_summaries'])
-    insights_path = Path(config['paths']['reports_insights'])
-    
     report_list = []
-    for report in reports:
-        report_path = summaries_path / report
-        if report_path.exists():
-            stat = report_path.stat()
-            report_list.append({
-                'name': report,
-                'size': f"{stat.st_size / 1024:.1f} KB",
-                'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                'type': 'CSV' if report.endswith('.csv') else 'Text Report'
-            })
+    for report, stat in _list_files(SUMMARIES_DIR, REPORT_SUFFIXES):
+        report_list.append({
+            'name': report,
+            'size': f"{stat.st_size / 1024:.1f} KB",
+            'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+            'type': 'CSV' if report.endswith('.csv') else 'Text Report'
+        })
     
     insight_list = []
-    for insight in insights:
-        insight_path = insights_path / insight
-        if insight_path.exists():
-            stat = insight_path.stat()
-            insight_list.append({
-                'name': insight,
-                'size': f"{stat.st_size / 1024:.1f} KB",
-                'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-            })
+    for insight, stat in _list_files(INSIGHTS_DIR, INSIGHT_SUFFIXES):
+        insight_list.append({
+            'name': insight,
+            'size': f"{stat.st_size / 1024:.1f} KB",
+            'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+        })
     
     return render_template('reports.html', reports=report_list, insights=insight_list)
 
 
+UPLOAD_BUFFER_SIZE = 1 << 20
+UPLOAD_HEADER_BYTES = 64 * 1024
+# Mirrors REQUIRED_COLUMNS in data_loader.csv_loader
+UPLOAD_REQUIRED_COLUMNS = ['transaction_date', 'customer_id', 'product_id',
+                           'quantity', 'unit_price', 'total_amount']
+
+
+def _missing_upload_columns(path):
+    """
+    Check an uploaded CSV header against the loader's required columns
+    
+    Args:
+        path: Uploaded file
+        
+    Returns:
+        list: Required columns absent from the header
+    """
+    with open(path, 'rb') as f:
+        head = f.read(UPLOAD_HEADER_BYTES)
+    first_line = head.split(b'\n', 1)[0].decode('utf-8-sig', errors='replace')
+    columns = next(csv.reader(io.StringIO(first_line)), [])
+    return [col for col in UPLOAD_REQUIRED_COLUMNS if col not in columns]
+
+
 @app.route('/upload', methods=['GET', 'POST'])
 def upload():
     """File upload page"""
@@ -186,7 +325,25 @@ def upload():
             filename = file.filename
             filepath = Path(app.config['UPLOAD_FOLDER']) / filename
             filepath.parent.mkdir(parents=True, exist_ok=True)
-            file.save(str(filepath))
+            
+            # Stage in the target directory so os.replace is an atomic rename.
+            # os.open with 0o666 lets the kernel apply the umask, as a plain open() would.
+            tmp_path = filepath.parent / f'.{filename}.{uuid.uuid4().hex}.part'
+            flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+            fd = os.open(tmp_path, flags, 0o666)
+            try:
+                with os.fdopen(fd, 'wb') as tmp:
+                    shutil.copyfileobj(file.stream, tmp, length=UPLOAD_BUFFER_SIZE)
+                
+                missing_columns = _missing_upload_columns(tmp_path)
+                if missing_columns:
+                    os.unlink(tmp_path)
+                    return jsonify({'error': f'Missing required columns: {missing_columns}'}), 400
+                os.replace(tmp_path, filepath)
+            except Exception:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                raise
             
             logger.info(f"File uploaded: {filename}")
             return jsonify({
@@ -200,105 +357,270 @@ def upload():
     return render_template('upload.html')
 
 
+_row_counts = {}
+
+
+def _csv_row_count(path):
+    """
+    Count data rows in a CSV file (cached by path and mtime)
+    
+    Args:
+        path: CSV file
+        
+    Returns:
+        int: Number of rows excluding the header
+    """
+    key = (path, path.stat().st_mtime)
+    if key not in _row_counts:
+        with open(path, 'rb') as f:
+            _row_counts[key] = max(sum(1 for _ in f) - 1, 0)
+    return _row_counts[key]
+
+
+def _conditional_page(source_path, render):
+    """
+    Serve a page rendered from a file, answering repeat views of an unchanged file with 304
+    
+    The validators come from the file's stat, so a matching conditional request
+    returns before render (and any file parsing) runs.
+    
+    Args:
+        source_path: File the page is rendered from
+        render: Callable returning the rendered HTML
+        
+    Returns:
+        flask.Response: Response with Last-Modified/ETag and conditional handling
+    """
+    stat = source_path.stat()
+    etag = f'{stat.st_mtime_ns:x}-{stat.st_size:x}'
+    last_modified = datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = make_response('', 304)
+    else:
+        response = make_response(render())
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.cache_control.max_age = 300
+    return response
+
+
 @app.route('/view_chart/<filename>')
 def view_chart(filename):
     """View a specific chart"""
-    config = load_config()
-    charts_path = Path(config['paths']['reports_charts'])
-    chart_path = charts_path / filename
+    chart_path = CHARTS_DIR / filename
     
     if chart_path.exists():
-        return send_file(str(chart_path))
+        # ETag/Last-Modified revalidation; the body goes out via sendfile
+        return send_from_directory(str(CHARTS_DIR.resolve()), filename, conditional=True, max_age=300)
     return "Chart not found", 404
 
 
 @app.route('/view_report/<filename>')
 def view_report(filename):
     """View a specific report"""
-    config = load_config()
-    summaries_path = Path(config['paths']['reports_summaries'])
-    report_path = summaries_path / filename
+    report_path = SUMMARIES_DIR / filename
     
     if report_path.exists():
         if filename.endswith('.csv'):
-            df = pd.read_csv(report_path)
-            return render_template('view_csv.html', 
-                                 filename=filename,
-                                 data=df.to_dict('records'),
-                                 columns=df.columns.tolist())
+            def render():
+                # Only the requested page of rows is parsed and rendered
+                page_num = max(request.args.get('page', 0, type=int), 0)
+                size = min(max(request.args.get('size', 1000, type=int), 1), 5000)
+                start = page_num * size
+                # Stream size-row chunks up to the requested one; memory stays at one page
+                with pd.read_csv(report_path, chunksize=size) as reader:
+                    df = next(islice(reader, page_num, page_num + 1), None)
+                if df is None:  # past the last page
+                    df = pd.read_csv(report_path, nrows=0)
+                total_rows = _csv_row_count(report_path)
+                return render_template('view_csv.html', 
+                                     filename=filename,
+                                     data=df.to_dict('records'),
+                                     columns=df.columns.tolist(),
+                                     page=page_num,
+                                     size=size,
+                                     start=start,
+                                     total_rows=total_rows,
+                                     has_next=start + len(df) < total_rows)
         else:
-            with open(report_path, 'r') as f:
-                content = f.read()
-            return render_template('view_report.html', 
-                                 filename=filename,
-                                 content=content)
+            def render():
+                return render_template('view_report.html', 
+                                     filename=filename,
+                                     content=_read_text(report_path))
+        return _conditional_page(report_path, render)
+    return "Report not found", 404
+
+
+@app.route('/download_report/<filename>')
+def download_report(filename):
+    """Download a raw report file"""
+    if (SUMMARIES_DIR / filename).exists():
+        return send_from_directory(str(SUMMARIES_DIR.resolve()), filename,
+                                   as_attachment=True, conditional=True, max_age=300)
     return "Report not found", 404
 
 
 @app.route('/view_insight/<filename>')
 def view_insight(filename):
     """View a specific insight file"""
-    config = load_config()
-    insights_path = Path(config['paths']['reports_insights'])
-    insight_path = insights_path / filename
+    insight_path = INSIGHTS_DIR / filename
     
     if insight_path.exists():
-        with open(insight_path, 'r') as f:
-            content = f.read()
-        return render_template('view_report.html', 
-                             filename=filename,
-                             content=content)
+        return _conditional_page(insight_path, lambda: render_template(
+            'view_report.html', filename=filename, content=_read_text(insight_path)))
     return "Insight file not found", 404
 
 
+def _json(obj):
+    """
+    Serialize obj as a JSON response, using orjson when available
+    
+    Args:
+        obj: JSON-serializable data
+        
+    Returns:
+        flask.Response: application/json response
+    """
+    if orjson is None:
+        return jsonify(obj)
+    return Response(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC),
+                    mimetype='application/json')
+
+
+# Summary files that may be rewritten in place without touching the directory mtime
+_DASHBOARD_FILES = [('report_', '.txt'), ('kpi_summary_', '.csv'), ('kpi_summary_', '.parquet')]
+
+
+def _dashboard_etag():
+    """Weak ETag value derived from the report directories' and latest summaries' mtimes"""
+    mtimes = [p.stat().st_mtime_ns for p in (CHARTS_DIR, SUMMARIES_DIR, INSIGHTS_DIR) if p.exists()]
+    if SUMMARIES_DIR.exists():
+        for prefix, suffix in _DASHBOARD_FILES:
+            latest = _latest_file(SUMMARIES_DIR, prefix, suffix)
+            if latest is not None:
+                mtimes.append(latest.stat().st_mtime_ns)
+    return f'{hash(tuple(mtimes)) & 0xffffffffffffffff:x}'
+
+
+def _not_modified(etag):
+    """
+    Build a 304 response if the client already holds the data tagged etag
+    
+    Args:
+        etag: Weak ETag value from _dashboard_etag
+        
+    Returns:
+        flask.Response or None: 304 response, or None if the data must be sent
+    """
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = make_response('', 304)
+    response.set_etag(etag, weak=True)
+    return response
+
+
 @app.route('/api/kpis')
 def api_kpis():
     """API endpoint for KPI data"""
+    etag = _dashboard_etag()
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+    
     kpi_data = get_kpi_summary()
-    return jsonify(kpi_data)
+    response = _json(kpi_data)
+    response.set_etag(etag, weak=True)
+    return response
 
 
 @app.route('/api/stats')
 def api_stats():
     """API endpoint for statistics"""
+    etag = _dashboard_etag()
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+    
     charts, reports, insights = get_reports_data()
-    return jsonify({
-        'charts': len([c for c in charts if c.endswith('.png')]),
-        'dashboards': len([c for c in charts if c.endswith('.html')]),
+    png_count, html_count = _count_chart_types(charts)
+    response = _json({
+        'charts': png_count,
+        'dashboards': html_count,
         'reports': len(reports),
         'insights': len(insights)
     })
+    response.set_etag(etag, weak=True)
+    return response
 
 
-@app.route('/run_demo')
-def run_demo():
-    """Trigger demo mode execution"""
+# Background demo runs by job id: {'status': 'running'|'finished', ...}
+_jobs = {}
+
+
+def _run_demo_job(job_id):
+    """Run demo mode in a subprocess and record its outcome under job_id"""
     try:
-        import subprocess
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [sys.executable, 'python/demo_mode.py'],
-            capture_output=True,
-            text=True,
-            timeout=120
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
         )
-        
-        if result.returncode == 0:
-            return jsonify({
-                'success': True,
-                'message': 'Demo mode executed successfully!',
-                'output': result.stdout
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'message': 'Demo mode execution failed',
-                'error': result.stderr
-            }), 500
+        try:
+            output, error = proc.communicate(timeout=120)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            output, error = proc.communicate()
+            error = f"Demo mode timed out after 120 seconds\n{error}"
+        _jobs[job_id] = {
+            'status': 'finished',
+            'returncode': proc.returncode,
+            'output': output,
+            'error': error
+        }
     except Exception as e:
+        _jobs[job_id] = {'status': 'finished', 'returncode': None, 'output': '', 'error': str(e)}
+    logger.info(f"Demo job {job_id} finished with return code {_jobs[job_id]['returncode']}")
+
+
+@app.route('/run_demo')
+def run_demo():
+    """Start demo mode in the background and return its job id"""
+    job_id = uuid.uuid4().hex
+    _jobs[job_id] = {'status': 'running'}
+    threading.Thread(target=_run_demo_job, args=(job_id,), daemon=True).start()
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status_url': url_for('run_demo_status', job_id=job_id)
+    }), 202
+
+
+@app.route('/run_demo/status/<job_id>')
+def run_demo_status(job_id):
+    """Report the status of a background demo run"""
+    job = _jobs.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': 'Unknown job id'}), 404
+    if job['status'] == 'running':
+        return jsonify({'status': 'running'})
+    if job['returncode'] == 0:
         return jsonify({
-            'success': False,
-            'message': f'Error: {str(e)}'
-        }), 500
+            'status': 'finished',
+            'success': True,
+            'message': 'Demo mode executed successfully!',
+            'output': job['output']
+        })
+    return jsonify({
+        'status': 'finished',
+        'success': False,
+        'message': 'Demo mode execution failed',
+        'error': job['error']
+    })
+
+
+# ASGI entry point: uvicorn python.web_app:asgi_app
+asgi_app = WsgiToAsgi(app) if WsgiToAsgi is not None else None
 
 
 if __name__ == '__main__':
@@ -311,5 +633,7 @@ if __name__ == '__main__':
     static_dir.mkdir(exist_ok=True)
     
     logger.info("Starting Flask web application...")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Debugger and reloader only on request; they wrap every request and fork a watcher
+    debug = bool(int(os.environ.get('FLASK_DEBUG', '0')))
+    app.run(debug=debug, use_reloader=debug, host='0.0.0.0', port=5000, threaded=True)
 